@@ -1,8 +1,18 @@
 from .read_config import read_config, Config, SourceConfig, Deployment, SafeGlobal
-from .validate_config import validate_config
 from .mask_sensitive_data import (
     mask_sensitive_data,
     mask_url_credentials,
     mask_source_sensitive_data,
     mask_all_sensitive_config_data,
 )
+
+
+def __getattr__(name: str):
+    # validate_config pulls in web3, import it on first use so reading config does not
+    if name == "validate_config":
+        from .validate_config import validate_config
+
+        # Replace the submodule bound by the import, as an eager import would
+        globals()["validate_config"] = validate_config
+        return validate_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
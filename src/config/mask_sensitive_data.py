@@ -10,7 +10,11 @@ if TYPE_CHECKING:
 
 def mask_sensitive_data(message: str, sensitive_value: str) -> str:
     """Mask sensitive data in error messages"""
-    if not sensitive_value or len(sensitive_value) < 8:
+    if (
+        not sensitive_value
+        or len(sensitive_value) < 8
+        or sensitive_value not in message
+    ):
         return message
     # Replace the sensitive value with masked version (show first 4 chars)
     masked = sensitive_value[:4] + "*" * (len(sensitive_value) - 4)
@@ -19,36 +23,30 @@ def mask_sensitive_data(message: str, sensitive_value: str) -> str:
 
 def mask_url_credentials(message: str, url: str) -> str:
     """Mask credentials in URLs (API keys in query params or auth)"""
-    if not url:
+    if not url or url not in message:
         return message
 
-    # Check if URL contains credentials, API keys, or paths (RPC URLs often have sensitive paths)
-    has_credentials = "@" in url
-    has_query_params = "?" in url
-    has_api_key_keywords = "apikey" in url.lower() or "api_key" in url.lower()
-    has_path = "/" in url.split("://")[1] if "://" in url else False
-
-    # Mask if URL has any sensitive indicators or paths (common in RPC URLs)
-    if has_credentials or has_query_params or has_api_key_keywords or has_path:
-        try:
-            if "://" in url:
-                protocol = url.split("://")[0]
-                rest = url.split("://")[1]
-
-                # Handle authentication in URL (user:password@domain)
-                if "@" in rest:
-                    domain_part = rest.split("@")[-1]  # Get part after @
-                    domain = domain_part.split("/")[0].split("?")[0]
-                    masked_url = f"{protocol}://{domain}/***"
-                else:
-                    # No auth, just get domain
-                    domain = rest.split("/")[0].split("?")[0]
-                    masked_url = f"{protocol}://{domain}/***"
-
-                message = message.replace(url, masked_url)
-        except:
-            # If parsing fails, just mask the whole URL
-            message = mask_sensitive_data(message, url)
+    protocol, separator, rest = url.partition("://")
+    if not separator:
+        return message  # Only URLs with a protocol are masked
+
+    # Mask if URL has credentials, query params, a path (common in RPC URLs) or API keys.
+    # Checks are ordered by how cheap and how likely they are, the first hit short-circuits.
+    if (
+        "/" in rest
+        or "?" in url
+        or "@" in url
+        or "apikey" in (lowered_url := url.lower())
+        or "api_key" in lowered_url
+    ):
+        # Handle authentication in URL (user:password@domain)
+        domain_part = rest.rpartition("@")[2]
+        domain = domain_part.partition("/")[0].partition("?")[0]
+        if not domain:
+            # No domain to keep visible, just mask the whole URL
+            return mask_sensitive_data(message, url)
+
+        message = message.replace(url, f"{protocol}://{domain}/***")
 
     return message
 
@@ -79,29 +77,18 @@ def mask_source_sensitive_data(message: str, source: "SourceConfig") -> str:
 
 def mask_all_sensitive_config_data(message: str, config: "Config") -> str:
     """Mask all sensitive data from config in error messages"""
-    if not config:
-        return message
-
-    # Mask telegram bot API key
-    if config.telegram_bot_api_key:
-        message = mask_sensitive_data(message, config.telegram_bot_api_key)
-
-    # Mask telegram group chat ID
-    if config.telegram_group_chat_id:
-        message = mask_sensitive_data(message, config.telegram_group_chat_id)
-
-    # Mask telegram owner addresses
-    if config.telegram_owner_nicknames:
-        for nickname, address in config.telegram_owner_nicknames.items():
-            if address and len(address) >= 8:
-                message = mask_sensitive_data(message, address)
-
-    # Mask target RPC URL credentials
-    if config.target_rpc:
-        message = mask_url_credentials(message, config.target_rpc)
-
-    # Mask source-specific sensitive data
-    for source in config.sources:
-        message = mask_source_sensitive_data(message, source)
+    if (
+        not config
+        or not config.sensitive_values_re
+        or not config.sensitive_values_re.search(message)
+    ):
+        return message  # Most messages contain no secret at all
+
+    # Telegram secrets, owner addresses, RPC URLs and per-source Safe secrets
+    for sensitive_value, is_url in config.sensitive_values:
+        if is_url:
+            message = mask_url_credentials(message, sensitive_value)
+        else:
+            message = mask_sensitive_data(message, sensitive_value)
 
     return message
@@ -1,11 +1,26 @@
 import os
-import json
-from web3 import Web3, constants
+import re
+import sys
+import orjson
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+_KEBAB_TABLE = str.maketrans("-", "_")
+
+# Same value as web3.constants.ADDRESS_ZERO, kept local so config loading does not import web3
+_ADDRESS_ZERO = "0x" + "0" * 40
+
+# Innermost ${VAR} or ${VAR:default} placeholder, i.e. one without a nested "${" inside
+_PLACEHOLDER_RE = re.compile(r"\$\{((?:(?!\$\{)[^:}])*)(?::((?:(?!\$\{)[^}])*))?\}")
+
+# Required keys of each config section, in the positional order of the dataclass fields
+_SAFE_GLOBAL_KEYS = itemgetter("safe_address", "proposer_private_key", "api_url")
+_DEPLOYMENT_KEYS = itemgetter("name", "source_core", "target_core")
+
+
+@dataclass(frozen=True, slots=True)
 class SafeGlobal:
     safe_address: str
     proposer_private_key: str
@@ -15,7 +30,7 @@ class SafeGlobal:
     eip_3770: str = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Deployment:
     name: str
     source_core: str
@@ -48,7 +63,7 @@ def _ensure_safe_global_fields(
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceConfig:
     name: str
     rpc: str
@@ -57,7 +72,7 @@ class SourceConfig:
     safe_global: SafeGlobal = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     telegram_bot_api_key: str
     telegram_group_chat_id: str
@@ -68,6 +83,44 @@ class Config:
     target_rpc: str
     target_core_helper: str
     sources: List[SourceConfig]
+    # (value, is_url) pairs to mask in error messages, in masking order, computed once
+    sensitive_values: Tuple[Tuple[str, bool], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    # Matches any of the sensitive values, lets messages without secrets skip masking
+    sensitive_values_re: Optional[re.Pattern] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        values = [
+            (self.telegram_bot_api_key, False),
+            (self.telegram_group_chat_id, False),
+            *((address, False) for address in self.telegram_owner_nicknames.values()),
+            (self.target_rpc, True),
+        ]
+        for source in self.sources:
+            values.append((source.rpc, True))
+            if source.safe_global:
+                values.append((source.safe_global.proposer_private_key, False))
+                values.append((source.safe_global.api_key, False))
+        # URLs are masked by structure, other values need at least 8 characters
+        # Frozen dataclass, the derived field has to be set through object.__setattr__
+        sensitive_values = tuple(
+            (value, is_url)
+            for value, is_url in values
+            if value and (is_url or len(value) >= 8)
+        )
+        object.__setattr__(self, "sensitive_values", sensitive_values)
+        # Longest first, so a value containing another one is matched whole
+        needles = sorted(
+            {value for value, _ in sensitive_values}, key=len, reverse=True
+        )
+        object.__setattr__(
+            self,
+            "sensitive_values_re",
+            re.compile("|".join(map(re.escape, needles))) if needles else None,
+        )
 
 
 def read_config(config_path: str) -> Config:
@@ -84,42 +137,51 @@ def read_config(config_path: str) -> Config:
         Config object with parsed and transformed configuration
     """
     # Read the JSON file
-    with open(config_path, "r") as file:
-        config = json.load(file)
+    with open(config_path, "rb") as file:
+        config = orjson.loads(file.read())
 
-    # Transform the configuration
-    transformed_config = _transform_config(config)
+    # Transform the configuration, reading each environment variable at most once
+    transformed_config = _transform_config(config, env_cache={})
 
     # Convert dictionary to typed Config object
     return _dict_to_config(transformed_config)
 
 
-def _transform_config(obj: Any) -> Any:
+def _transform_config(obj: Any, env_cache: Dict[str, Optional[str]] = None) -> Any:
     """
-    Recursively transform the configuration object:
+    Transform the configuration object (iteratively, without recursion):
     - Convert kebab-case keys to snake_case
     - Replace ${VAR:default} patterns with environment variables (supports nested substitution)
     """
-    if isinstance(obj, dict):
-        transformed = {}
-        for key, value in obj.items():
+    root = [obj]
+    # (container, key) slots whose value still has to be transformed
+    pending = [(root, 0)]
+    while pending:
+        container, slot = pending.pop()
+        value = container[slot]
+        value_type = type(value)
+        if value_type is dict:
             # Convert kebab-case to snake_case
-            snake_key = key.replace("-", "_")
-            # Recursively transform the value
-            transformed[snake_key] = _transform_config(value)
-        return transformed
-    elif isinstance(obj, list):
-        # Transform each item in the list
-        return [_transform_config(item) for item in obj]
-    elif isinstance(obj, str):
-        # Handle environment variable substitution
-        return _substitute_env_vars(obj)
-    else:
-        # Return primitive types as-is
-        return obj
-
-
-def _substitute_env_vars(value: str, visited_vars: set = None) -> str:
+            transformed = {
+                (key.translate(_KEBAB_TABLE) if "-" in key else key): item
+                for key, item in value.items()
+            }
+            container[slot] = transformed
+            pending.extend((transformed, key) for key in transformed)
+        elif value_type is list:
+            transformed = list(value)
+            container[slot] = transformed
+            pending.extend((transformed, index) for index in range(len(transformed)))
+        elif value_type is str:
+            # Handle environment variable substitution
+            container[slot] = _substitute_env_vars(value, env_cache=env_cache)
+        # Primitive types are kept as-is
+    return root[0]
+
+
+def _substitute_env_vars(
+    value: str, visited_vars: set = None, env_cache: Dict[str, Optional[str]] = None
+) -> str:
     """
     Replace ${VAR:default} patterns with environment variables or default values.
     Supports nested variable substitution with circular reference detection.
@@ -133,6 +195,7 @@ def _substitute_env_vars(value: str, visited_vars: set = None) -> str:
     Args:
         value: The string containing variable patterns to substitute
         visited_vars: Set of variable names being processed (for circular reference detection)
+        env_cache: Environment variable values already read during this config load
 
     Returns:
         String with all variable patterns substituted
@@ -140,67 +203,49 @@ def _substitute_env_vars(value: str, visited_vars: set = None) -> str:
     Raises:
         ValueError: If a circular reference is detected in variable substitution
     """
+    if "${" not in value:
+        return value  # Fast path: most config values have no placeholders
+
     if visited_vars is None:
         visited_vars = set()
+    if env_cache is None:
+        env_cache = {}
 
-    result = value
-    max_iterations = 64
-    iteration = 0
-
-    while iteration < max_iterations:
-        iteration += 1
-        start = result.rfind("${")
-        if start == -1:
-            break  # No more patterns
-
-        # Parse variable name until ':' or '}'
-        name_start = start + 2
-        i = name_start
-        while i < len(result) and result[i] not in ":}":
-            i += 1
-        if i >= len(result):
-            break  # Incomplete pattern; leave as-is
-
-        var_name = result[name_start:i]
+    def resolve(match: re.Match) -> str:
+        var_name = match.group(1)
         if not var_name:
-            # Skip malformed and continue searching earlier occurrences
-            result = result[:start] + result[start + 2 :]
-            continue
-
-        # Determine default value and closing brace position
-        if result[i] == "}":
-            default_value = ""
-            close = i
-        else:
-            # We started from the last '${', so the next '}' is the matching close
-            default_start = i + 1
-            close = result.find("}", default_start)
-            if close == -1:
-                break  # Unmatched; leave as-is
-            default_value = result[default_start:close]
+            # Malformed, drop the "${" and keep the rest
+            return match.group(0)[2:]
 
         if var_name in visited_vars:
             raise ValueError(
                 f"Circular reference detected in variable substitution: {var_name}"
             )
 
-        env_value = os.getenv(var_name)
-        replacement_source = env_value if env_value else default_value
-
-        # Recursively resolve nested variables in the replacement source
-        new_visited = visited_vars.copy()
-        new_visited.add(var_name)
-        replacement = _substitute_env_vars(replacement_source, new_visited)
+        if var_name not in env_cache:
+            env_cache[var_name] = os.getenv(var_name)
+        env_value = env_cache[var_name]
+        replacement_source = env_value if env_value else (match.group(2) or "")
 
-        # Splice the resolved value back into the string
-        result = result[:start] + replacement + result[close + 1 :]
+        # Recursively resolve nested variables in the replacement source.
+        # Resolution is strictly nested, so a single shared set is enough.
+        visited_vars.add(var_name)
+        try:
+            return _substitute_env_vars(replacement_source, visited_vars, env_cache)
+        finally:
+            visited_vars.discard(var_name)
 
-    if iteration >= max_iterations:
-        raise ValueError(
-            f"Maximum substitution iterations exceeded. Possible complex circular reference in: {value}"
-        )
+    # Each pass resolves the innermost placeholders, so nested defaults resolve inside-out
+    result = value
+    max_iterations = 64
+    for _ in range(max_iterations):
+        result, count = _PLACEHOLDER_RE.subn(resolve, result)
+        if count == 0:
+            return result
 
-    return result
+    raise ValueError(
+        f"Maximum substitution iterations exceeded. Possible complex circular reference in: {value}"
+    )
 
 
 def _parse_telegram_owners(telegram_owner_nicknames: str) -> Dict[str, str]:
@@ -234,7 +279,7 @@ def _parse_telegram_owners(telegram_owner_nicknames: str) -> Dict[str, str]:
             result[nickname.strip().lstrip("@")] = address.strip()
         else:
             # Format: @nickname (no address specified)
-            result[entry.strip().lstrip("@")] = constants.ADDRESS_ZERO
+            result[entry.strip().lstrip("@")] = _ADDRESS_ZERO
 
     return result
 
@@ -307,7 +352,7 @@ def _dict_to_config(config_dict: Dict[str, Any]) -> Config:
 
     # Convert source configurations
     def create_source_config(source_dict: Dict[str, Any]) -> SourceConfig:
-        source_name = source_dict["name"]
+        source_name = sys.intern(source_dict["name"])
 
         # Handle optional chain-level safe_global configuration
         chain_safe_global = None
@@ -320,12 +365,10 @@ def _dict_to_config(config_dict: Dict[str, Any]) -> Config:
                 eip_3770 = source_name.lower()
 
             chain_safe_global = SafeGlobal(
-                safe_address=safe_global_dict["safe_address"],
-                proposer_private_key=safe_global_dict["proposer_private_key"],
-                api_url=safe_global_dict["api_url"],
+                *_SAFE_GLOBAL_KEYS(safe_global_dict),
                 api_key=safe_global_dict.get("api_key"),
                 web_client_url=safe_global_dict.get("web_client_url"),
-                eip_3770=eip_3770,
+                eip_3770=sys.intern(eip_3770),
             )
 
         # Create deployments with optional safe_global_overrides merged
@@ -337,9 +380,8 @@ def _dict_to_config(config_dict: Dict[str, Any]) -> Config:
             )
 
             return Deployment(
-                name=dep["name"],
-                source_core=dep["source_core"],
-                target_core=dep["target_core"],
+                # Stripped once here; names and addresses repeat across sources, share one copy
+                *(sys.intern((value or "").strip()) for value in _DEPLOYMENT_KEYS(dep)),
                 safe_global=deployment_safe_global,
             )
 
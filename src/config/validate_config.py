@@ -1,14 +1,26 @@
 import sys
 import os
-from packaging.version import Version
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Optional
 from web3 import constants
 
 if __name__ == "__main__":
     sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from web3_scripts import get_w3, print_colored, get_contract, Account, Web3
-from safe_global import client_gateway_api, transaction_api
-from safe_global.multi_send_call import multi_send_contracts
+from web3_scripts import (
+    get_w3,
+    get_chain_id,
+    print_colored,
+    get_contract,
+    bound_call,
+    multicall,
+    run_in_parallel,
+    run_in_parallel_buffered,
+    Account,
+    Web3,
+)
 
 # Handle both relative and absolute imports
 try:
@@ -28,12 +40,44 @@ except ImportError:
     )
 
 
+MIN_SAFE_VERSION = (1, 3, 0)
+
+
+@dataclass
+class DeploymentState:
+    """
+    On-chain values of a deployment pair needed for its validation.
+    Symbols are not fetched for deployments that skip symbol validation.
+    A read that failed holds its exception, so it is reported for this deployment only.
+    """
+
+    source_core_address: bytes  # TargetCore.sourceCoreAddress()
+    target_core_address: bytes  # SourceCore.targetCoreAddress()
+    source_core_symbol: str = None
+    target_oft_symbol: str = None
+    target_vault_symbol: str = None
+    target_oft_address: str = None  # TargetCore.oft()
+    target_vault_address: str = None  # TargetCore.vault()
+
+
 def validate_config(config: Config):
+    # Safe state includes the nonce, it must not outlive a validation run
+    _get_safe_state.cache_clear()
+
+    # Reject malformed deployments before any network I/O
+    for source in config.sources:
+        validate_deployments_structure(source)
+
     w3 = get_w3(config.target_rpc)
     validate_rpc_url(w3, "target")
     validate_target_helper(w3, config)
-    for source in config.sources:
-        validate_source(w3, source)
+
+    # Sources are independent chains, validate them concurrently and print
+    # the output of each source in config order once it is done
+    run_in_parallel_buffered(
+        *(partial(validate_source, w3, source) for source in config.sources),
+        max_workers=32,
+    )
 
 
 def validate_source(target_w3: Web3, source: SourceConfig):
@@ -92,11 +136,15 @@ def validate_safe_global(w3: Web3, safe: SafeGlobal, label: str):
         return
 
     print(f"Validating safe global {safe.safe_address} for {label}...")
-    safe_contract = get_contract(w3, safe.safe_address, "Safe")
+    # Safe reads and the client gateway probe hit different services, overlap them
+    (version, nonce), gateway_state = run_in_parallel(
+        lambda: _get_safe_state(w3, safe.safe_address),
+        lambda: _fetch_client_gateway_state(w3, safe),
+    )
 
-    min_version = Version("1.3.0")
-    version = Version(safe_contract.functions.VERSION().call())
-    if version < min_version:
+    release = _parse_safe_version(version)
+    if release < MIN_SAFE_VERSION:
+        min_version = ".".join(map(str, MIN_SAFE_VERSION))
         raise Exception(
             f"Safe contract version {version} is not supported for {label}, support for {min_version} or higher is required"
         )
@@ -106,12 +154,11 @@ def validate_safe_global(w3: Web3, safe: SafeGlobal, label: str):
     else:
         proposer_address = "N/A"
 
-    nonce = safe_contract.functions.nonce().call()
     print(f"Proposer address: {proposer_address}, version: {version}, nonce: {nonce}")
 
-    validate_multi_send_contract_compatibility(w3, safe)
+    validate_multi_send_contract_compatibility(w3, safe, release)
 
-    if validate_safe_client_gateway_api_url(w3, safe, nonce):
+    if validate_safe_client_gateway_api_url(nonce, gateway_state):
         pass
     elif not validate_safe_transaction_api_url(safe):
         # Mask API URL which might contain credentials
@@ -120,39 +167,75 @@ def validate_safe_global(w3: Web3, safe: SafeGlobal, label: str):
         raise Exception(masked_error)
 
 
+# (chain_id, address) -> contract code. Code is immutable, so safes of sources sharing
+# a chain check the multi-send deployment with a single eth_getCode
+_contract_codes = {}
+
+
+def _get_code(w3: Web3, address: str) -> bytes:
+    key = (get_chain_id(w3), address)
+    if key not in _contract_codes:
+        _contract_codes[key] = w3.eth.get_code(Web3.to_checksum_address(address))
+    return _contract_codes[key]
+
+
+def _parse_safe_version(version: str) -> tuple:
+    """
+    Parse a Safe VERSION() string (e.g. "1.3.0" or "1.3.0+L2") into (major, minor, patch).
+    """
+    release = str(version).partition("+")[0].split(".")
+    if not 1 <= len(release) <= 3 or not all(part.isdigit() for part in release):
+        raise Exception(f"Invalid Safe contract version: {version}")
+    return (tuple(int(part) for part in release) + (0, 0, 0))[:3]
+
+
+@lru_cache(maxsize=None)
+def _get_safe_state(w3: Web3, safe_address: str) -> tuple:
+    """
+    (VERSION, nonce) of a Safe read in one multicall, once per validation run
+    even if the same Safe is referenced by several configs.
+    validate_config clears the cache at the start of each run.
+    """
+    safe_contract = get_contract(w3, safe_address, "Safe").functions
+    return tuple(
+        multicall(
+            w3,
+            [bound_call(safe_contract, "VERSION"), bound_call(safe_contract, "nonce")],
+        )
+    )
+
+
 def validate_safe_owner_addresses(config: Config):
     owners = config.telegram_owner_nicknames
     if len(owners) == 0:
         print("No telegram nicknames for safe owners are set, skipping validation...")
         return
 
-    all_zero = True
-    all_non_zero = True
     for nickname, address in owners.items():
         if not address.startswith("0x") or not Web3.is_address(address):
             raise ValueError(f"Invalid address for nickname {nickname}!")
-        if address != constants.ADDRESS_ZERO:
-            all_zero = False
-        else:
-            all_non_zero = False
 
-    if not all_zero and not all_non_zero:
+    # Omitted addresses are parsed as the zero address
+    addresses = list(owners.values())
+    zero_count = addresses.count(constants.ADDRESS_ZERO)
+    if 0 < zero_count < len(addresses):
         raise ValueError("All addresses must be set or all must be omitted!")
 
-    if all_non_zero and len(owners) != len(set(owners.values())):
+    if zero_count == 0 and len(addresses) != len(set(addresses)):
         raise ValueError("Duplicate owner addresses found!")
 
 
-def validate_multi_send_contract_compatibility(w3: Web3, safe: SafeGlobal):
+def validate_multi_send_contract_compatibility(
+    w3: Web3, safe: SafeGlobal, release: tuple
+):
+    # Safe dependencies are only needed for sources with a safe configured
+    from safe_global.multi_send_call import multi_send_contracts
+
     print(
         f"Validating multi-send contract compatibility for safe {safe.safe_address}..."
     )
 
-    safe_contract = get_contract(w3, safe.safe_address, "Safe")
-    version_str = safe_contract.functions.VERSION().call()
-    version = Version(version_str)
-
-    base_version = version.base_version
+    base_version = ".".join(map(str, release))
     if base_version not in multi_send_contracts:
         supported_versions = ", ".join(multi_send_contracts.keys())
         raise Exception(
@@ -162,21 +245,19 @@ def validate_multi_send_contract_compatibility(w3: Web3, safe: SafeGlobal):
 
     multi_send_address = multi_send_contracts[base_version]
     # Check that the contract is deployed on the current network
-    code = w3.eth.get_code(Web3.to_checksum_address(multi_send_address))
-    bytecode = code.hex()
-    if not bytecode or bytecode == "0x":
+    code = _get_code(w3, multi_send_address)
+    if not code:
         raise Exception(
             f"Multi-send contract {multi_send_address} (version {base_version}) "
-            f"is not deployed on the current network (chain ID: {w3.eth.chain_id})"
+            f"is not deployed on the current network (chain ID: {get_chain_id(w3)})"
         )
 
     # Validate bytecode contains `multiSend` function selector
-    MULTISEND_FUNCTION_SELECTOR = "8d80ff0a"  # multiSend(bytes)
-    clean_bytecode = bytecode.lower().replace("0x", "")
-    if MULTISEND_FUNCTION_SELECTOR not in clean_bytecode:
+    MULTISEND_FUNCTION_SELECTOR = bytes.fromhex("8d80ff0a")  # multiSend(bytes)
+    if MULTISEND_FUNCTION_SELECTOR not in code:
         raise Exception(
             f"Multi-send contract {multi_send_address} (version {base_version}) "
-            f"does not contain multiSend function (selector: {MULTISEND_FUNCTION_SELECTOR})"
+            f"does not contain multiSend function (selector: {MULTISEND_FUNCTION_SELECTOR.hex()})"
         )
 
     print(
@@ -184,16 +265,27 @@ def validate_multi_send_contract_compatibility(w3: Web3, safe: SafeGlobal):
     )
 
 
-def validate_safe_client_gateway_api_url(
-    w3: Web3, safe: SafeGlobal, contract_nonce: int
-) -> bool:
-    chainId = w3.eth.chain_id
-    version = None
+def _fetch_client_gateway_state(w3: Web3, safe: SafeGlobal) -> Optional[tuple]:
+    """
+    (version, nonce) from the client gateway, or None if api_url is not a client gateway.
+    """
+    from safe_global import client_gateway_api
+
+    chainId = get_chain_id(w3)
     try:
         version = client_gateway_api.get_version(safe.api_url)
         nonce = client_gateway_api.get_nonce(safe.api_url, chainId, safe.safe_address)
-    except Exception as e:
+    except Exception:
+        return None
+    return version, nonce
+
+
+def validate_safe_client_gateway_api_url(
+    contract_nonce: int, gateway_state: Optional[tuple]
+) -> bool:
+    if gateway_state is None:
         return False
+    version, nonce = gateway_state
     if contract_nonce != nonce:
         raise Exception(
             f"Safe contract nonce {contract_nonce} does not match the nonce from client gateway {nonce}"
@@ -203,6 +295,8 @@ def validate_safe_client_gateway_api_url(
 
 
 def validate_safe_transaction_api_url(safe: SafeGlobal):
+    from safe_global import transaction_api
+
     if not safe.api_key:
         print("No API key for safe transaction API is set, skipping validation...")
         return True
@@ -217,31 +311,39 @@ def validate_safe_transaction_api_url(safe: SafeGlobal):
 def validate_rpc_url(w3: Web3, label: str):
     """
     Validate the RPC URL is an active RPC endpoint.
+    The probe fetches the chain id, which later checks reuse from the cache.
     """
     print(f"Validating RPC URL for {label}...")
-    if w3.eth.get_block("latest").number <= 0:
-        # Mask RPC URL which might contain credentials
+    try:
+        get_chain_id(w3)
+    except Exception:
+        # Mask RPC URL which might contain credentials, the original error may include it too
         rpc_url = str(w3.provider.endpoint_uri)
         error_msg = f"RPC URL {rpc_url} is not valid"
         masked_error = mask_url_credentials(error_msg, rpc_url)
-        raise Exception(masked_error)
-
+        raise Exception(masked_error) from None
 
-def validate_deployments(source_w3: Web3, target_w3: Web3, source: SourceConfig):
-    # Track unique values for validation
-    names = set()
-    source_cores = set()
-    target_cores = set()
 
+def validate_deployments_structure(source: SourceConfig):
+    """
+    Validate deployments of a source without on-chain reads: names and cores are set,
+    cores are different, names and cores are unique.
+    """
     for deployment in source.deployments:
+        # Validate deployment.name is not empty, it would match every symbol
+        if not deployment.name:
+            raise Exception(
+                f"Deployment name cannot be empty for deployment {deployment.source_core} in source {source.name}"
+            )
+
         # Validate deployment.source_core is not empty
-        if not deployment.source_core or deployment.source_core.strip() == "":
+        if not deployment.source_core:
             raise Exception(
                 f"Source core cannot be empty for deployment {deployment.name} in source {source.name}"
             )
 
         # Validate deployment.target_core is not empty
-        if not deployment.target_core or deployment.target_core.strip() == "":
+        if not deployment.target_core:
             raise Exception(
                 f"Target core cannot be empty for deployment {deployment.name} in source {source.name}"
             )
@@ -252,46 +354,132 @@ def validate_deployments(source_w3: Web3, target_w3: Web3, source: SourceConfig)
                 f"Source core and target core must be different for deployment {deployment.name} in source {source.name}"
             )
 
-        # Validate that deployment.name is unique in source.deployments array
-        if deployment.name in names:
+    # Validate that names, source cores and target cores are unique in source.deployments array
+    for label, values in (
+        ("Deployment name", (deployment.name for deployment in source.deployments)),
+        ("Source core", (deployment.source_core for deployment in source.deployments)),
+        ("Target core", (deployment.target_core for deployment in source.deployments)),
+    ):
+        duplicates = [
+            f"'{value}'" for value, count in Counter(values).items() if count > 1
+        ]
+        if duplicates:
             raise Exception(
-                f"Deployment name '{deployment.name}' is not unique in source {source.name}"
+                f"{label} {', '.join(duplicates)} is not unique in source {source.name}"
             )
-        names.add(deployment.name)
 
-        # Validate that deployment.source_core is unique in source.deployments array
-        if deployment.source_core in source_cores:
-            raise Exception(
-                f"Source core '{deployment.source_core}' is not unique in source {source.name}"
-            )
-        source_cores.add(deployment.source_core)
-
-        # Validate that deployment.target_core is unique in source.deployments array
-        if deployment.target_core in target_cores:
-            raise Exception(
-                f"Target core '{deployment.target_core}' is not unique in source {source.name}"
-            )
-        target_cores.add(deployment.target_core)
 
-        # Validate source <-> target core addresses refer to each other
+def validate_deployments(source_w3: Web3, target_w3: Web3, source: SourceConfig):
+    """
+    Validate on-chain state of deployments that passed validate_deployments_structure.
+    """
+    # Validate source <-> target core addresses refer to each other
+    states = fetch_deployment_states(source_w3, target_w3, source.deployments)
+    for deployment, state in zip(source.deployments, states):
         print(
             f"Validating deployment pair {deployment.name} ({deployment.source_core} <-> {deployment.target_core}) for source {source.name}..."
         )
-        validate_deployment_pair(source_w3, target_w3, deployment)
+        validate_deployment_pair(deployment, state)
+
+    # Token symbols are only read once every pair is known to be valid
+    fetch_deployment_symbols(target_w3, source.deployments, states)
+    for deployment, state in zip(source.deployments, states):
+        validate_symbol(deployment, state)
+
+
+def fetch_deployment_states(
+    source_w3: Web3, target_w3: Web3, deployments: tuple
+) -> list:
+    """
+    Read the on-chain state of every deployment pair with one multicall per chain.
+    A failed read is stored in the state of its deployment instead of failing the source.
+    """
+    source_calls = []
+    target_calls = []
+    for deployment in deployments:
+        source_core = get_contract(
+            source_w3, deployment.source_core, "SourceCore"
+        ).functions
+        target_core = get_contract(
+            target_w3, deployment.target_core, "TargetCore"
+        ).functions
+        source_calls.append(bound_call(source_core, "targetCoreAddress"))
+        target_calls.append(bound_call(target_core, "sourceCoreAddress"))
+        if not _skips_symbol_validation(deployment):
+            source_calls.append(bound_call(source_core, "symbol"))
+            target_calls.append(bound_call(target_core, "oft"))
+            target_calls.append(bound_call(target_core, "vault"))
+
+    # Source and target chains are independent endpoints, query them concurrently
+    source_results, target_results = map(
+        iter,
+        run_in_parallel(
+            lambda: multicall(source_w3, source_calls, allow_failure=True),
+            lambda: multicall(target_w3, target_calls, allow_failure=True),
+        ),
+    )
+
+    # Results are consumed in the same order the calls were queued
+    states = []
+    for deployment in deployments:
+        state = DeploymentState(
+            source_core_address=next(target_results),
+            target_core_address=next(source_results),
+        )
+        if not _skips_symbol_validation(deployment):
+            state.source_core_symbol = next(source_results)
+            state.target_oft_address = next(target_results)
+            state.target_vault_address = next(target_results)
+        states.append(state)
+    return states
+
+
+def fetch_deployment_symbols(target_w3: Web3, deployments: tuple, states: list):
+    """
+    Read the OFT and vault symbols of deployments with symbol validation in one multicall.
+    """
+    token_calls = []
+    for deployment, state in zip(deployments, states):
+        if not _skips_symbol_validation(deployment):
+            _raise_read_error(deployment, state.source_core_symbol)
+            _raise_read_error(deployment, state.target_oft_address)
+            _raise_read_error(deployment, state.target_vault_address)
+            for token_address in (state.target_oft_address, state.target_vault_address):
+                token = get_contract(target_w3, token_address, "SourceCore").functions
+                token_calls.append(bound_call(token, "symbol"))
+
+    token_symbols = iter(multicall(target_w3, token_calls, allow_failure=True))
+    for deployment, state in zip(deployments, states):
+        if not _skips_symbol_validation(deployment):
+            state.target_oft_symbol = next(token_symbols)
+            state.target_vault_symbol = next(token_symbols)
+            _raise_read_error(deployment, state.target_oft_symbol)
+            _raise_read_error(deployment, state.target_vault_symbol)
+
+
+def _raise_read_error(deployment: Deployment, value):
+    if isinstance(value, Exception):
+        raise Exception(
+            f"Failed to read on-chain state for deployment {deployment.name} ({deployment.source_core} <-> {deployment.target_core}): {value}"
+        )
+
 
+def _skips_symbol_validation(deployment: Deployment) -> bool:
+    return deployment.name.startswith("_")
 
-def validate_deployment_pair(source_w3: Web3, target_w3: Web3, deployment: Deployment):
+
+def validate_deployment_pair(deployment: Deployment, state: DeploymentState):
     """
     Validate that the source and target core addresses are correct (refer to each other).
     """
-    source_contract = get_contract(source_w3, deployment.source_core, "SourceCore")
-    target_contract = get_contract(target_w3, deployment.target_core, "TargetCore")
+    _raise_read_error(deployment, state.source_core_address)
+    _raise_read_error(deployment, state.target_core_address)
 
     source_core_address_bytes32 = Web3.to_checksum_address(
-        target_contract.functions.sourceCoreAddress().call()[-20:].hex()
+        state.source_core_address[-20:]
     )
     target_core_address_bytes32 = Web3.to_checksum_address(
-        source_contract.functions.targetCoreAddress().call()[-20:].hex()
+        state.target_core_address[-20:]
     )
 
     if source_core_address_bytes32 != deployment.source_core:
@@ -299,8 +487,6 @@ def validate_deployment_pair(source_w3: Web3, target_w3: Web3, deployment: Deplo
     if target_core_address_bytes32 != deployment.target_core:
         raise Exception(f"Target core address mismatch for {deployment.name}")
 
-    validate_symbol(source_w3, target_w3, deployment)
-
 
 def validate_source_helper(w3: Web3, source: SourceConfig):
     """
@@ -311,10 +497,18 @@ def validate_source_helper(w3: Web3, source: SourceConfig):
         source_helper_contract = get_contract(
             w3, source.source_core_helper, "SourceHelper"
         )
-        for deployment in source.deployments:
-            value = source_helper_contract.functions.getSourceValue(
-                deployment.source_core
-            ).call()
+        values = multicall(
+            w3,
+            [
+                bound_call(
+                    source_helper_contract.functions,
+                    "getSourceValue",
+                    deployment.source_core,
+                )
+                for deployment in source.deployments
+            ],
+        )
+        for deployment, value in zip(source.deployments, values):
             if value == 0:
                 print_colored(
                     f"Source value is 0 for {deployment.name} on {source.name}",
@@ -336,12 +530,27 @@ def validate_target_helper(w3: Web3, config: Config):
         target_helper_contract = get_contract(
             w3, config.target_core_helper, "TargetHelper"
         )
+        # Target cores may repeat across sources, read each of them once
+        target_cores = list(
+            dict.fromkeys(
+                deployment.target_core
+                for source in config.sources
+                for deployment in source.deployments
+            )
+        )
+        values = multicall(
+            w3,
+            [
+                bound_call(
+                    target_helper_contract.functions, "getTargetValue", target_core
+                )
+                for target_core in target_cores
+            ],
+        )
+        target_values = dict(zip(target_cores, values))
         for source in config.sources:
             for deployment in source.deployments:
-                value = target_helper_contract.functions.getTargetValue(
-                    deployment.target_core
-                ).call()
-                if value == 0:
+                if target_values[deployment.target_core] == 0:
                     print_colored(
                         f"Target value is 0 for {deployment.name} on {source.name}",
                         "yellow",
@@ -353,51 +562,38 @@ def validate_target_helper(w3: Web3, config: Config):
         raise Exception(masked_error)
 
 
-def validate_symbol(source_w3: Web3, target_w3: Web3, deployment: Deployment):
+def validate_symbol(deployment: Deployment, state: DeploymentState):
     """
     Validate that the deployment name (from config.json) matches the symbol of the source core, target OFT, and target vault.
     """
     print(f"Validating symbol matching for {deployment.name}...")
-    if deployment.name.startswith("_"):
+    if _skips_symbol_validation(deployment):
         print(
             f"Skipping symbol validation for {deployment.name} (due to '_' prefix)..."
         )
         return
 
-    source_contract = get_contract(source_w3, deployment.source_core, "SourceCore")
-
-    target_oft_address = (
-        get_contract(target_w3, deployment.target_core, "TargetCore")
-        .functions.oft()
-        .call()
-    )
-    target_vault_address = (
-        get_contract(target_w3, deployment.target_core, "TargetCore")
-        .functions.vault()
-        .call()
-    )
-
-    target_oft_contract = get_contract(target_w3, target_oft_address, "SourceCore")
-    target_vault_contract = get_contract(target_w3, target_vault_address, "SourceCore")
-
-    source_core_symbol = source_contract.functions.symbol().call()
-    target_oft_symbol = target_oft_contract.functions.symbol().call()
-    target_vault_symbol = target_vault_contract.functions.symbol().call()
+    source_core_symbol = state.source_core_symbol
+    target_oft_symbol = state.target_oft_symbol
+    target_vault_symbol = state.target_vault_symbol
 
     unique_symbols = set([source_core_symbol, target_oft_symbol, target_vault_symbol])
-    for symbol in unique_symbols:
-        if not deployment.name in symbol:
-            raise Exception(
-                f"Deployment name {deployment.name} should be substring of every symbol: {', '.join(unique_symbols)}. "
-                f"Source core: {source_core_symbol}, Target OFT: {target_oft_symbol}, Target Vault: {target_vault_symbol}"
-            )
+    # Compare case-insensitively, symbols may use a different case than the name
+    name = deployment.name.lower()
+    mismatched_symbols = [
+        symbol for symbol in unique_symbols if name not in symbol.lower()
+    ]
+    if mismatched_symbols:
+        raise Exception(
+            f"Deployment name {deployment.name} should be substring of every symbol: {', '.join(mismatched_symbols)} do not match. "
+            f"Source core: {source_core_symbol}, Target OFT: {target_oft_symbol}, Target Vault: {target_vault_symbol}"
+        )
     print(
         f"Deployment name {deployment.name} matches every symbol: {', '.join(unique_symbols)} ✅"
     )
 
 
 if __name__ == "__main__":
-    import os
     import dotenv
 
     dotenv.load_dotenv()
@@ -2,6 +2,7 @@ import dotenv
 import os
 import asyncio
 from collections import defaultdict
+from functools import partial
 from typing import List, Optional, Tuple, Dict
 
 from telegram_bot import send_message, print_telegram_info
@@ -23,7 +24,9 @@ from web3_scripts import (
 from safe_global import PendingTransactionInfo, propose_tx_if_needed
 from dataclasses import dataclass
 
-from web3_scripts.base import print_colored
+from web3_scripts.base import print_colored, run_in_parallel_buffered
+
+ORACLE_VALIDATION_CONCURRENCY = 8
 
 
 @dataclass
@@ -59,7 +62,7 @@ async def main():
         )
 
         # Validate and get oracles data
-        oracle_validation_results = validate_oracles(config)
+        oracle_validation_results = await validate_oracles(config)
 
         # Compose message with oracle statuses
         message = compose_oracle_data_message(config, oracle_validation_results)
@@ -76,6 +79,7 @@ async def main():
         safe_proposals = propose_tx_to_update_oracle(oracle_validation_results)
 
         # Compose message with safe data
+        messages = []
         for source, safe_global, safe_proposal in safe_proposals:
             message = compose_safe_proposal_message(
                 config.telegram_owner_nicknames,
@@ -83,8 +87,6 @@ async def main():
                 safe_global,
                 safe_proposal,
             )
-
-            # Send message with safe proposal for each source
             if message:
                 # Only add prefix for newly created transactions
                 if (
@@ -96,15 +98,19 @@ async def main():
                         + "\n"
                         + message
                     )
-
-                await send_message(
-                    config.telegram_bot_api_key,
-                    config.telegram_group_chat_id,
-                    message,
-                    reply_to_message_id=(
-                        status_message.message_id if status_message else None
-                    ),
-                )
+                messages.append(message)
+
+        # Send message with safe proposal for each source, one at a time so
+        # they appear in the chat in the same order on every run
+        for message in messages:
+            await send_message(
+                config.telegram_bot_api_key,
+                config.telegram_group_chat_id,
+                message,
+                reply_to_message_id=(
+                    status_message.message_id if status_message else None
+                ),
+            )
         print(f"Sent {len(safe_proposals)} message(s) with safe proposal")
     except FileNotFoundError:
         print(f"Error: config.json not found")
@@ -127,54 +133,61 @@ def compose_oracle_data_message(
     if len(oracle_validation_results) == 0:
         return ""
 
-    # Skip if there are no required (or recent) updates
-    has_any_problem = any(
-        oracle_data.validation is None  # Error during validation on-chain data
-        or oracle_data.validation.almost_expired
-        or oracle_data.validation.transfer_in_progress
-        or oracle_data.validation.incorrect_value
-        for _, oracle_data in oracle_validation_results
-    )
-    has_recent_update = any(
-        oracle_data.validation is not None and oracle_data.validation.recently_updated
-        for _, oracle_data in oracle_validation_results
-    )
-    should_report = has_any_problem or has_recent_update
-    if not should_report:
-        return ""
-
-    # Group validation results by source.name
+    # Group validation results by source.name, noting whether anything needs a report
     grouped_data: defaultdict[str, List[OracleData]] = defaultdict(list)
+    should_report = False
     for source, oracle_data in oracle_validation_results:
         grouped_data[source.name].append(oracle_data)
+        validation = oracle_data.validation
+        should_report = should_report or (
+            validation is None  # Error during validation on-chain data
+            or validation.almost_expired
+            or validation.transfer_in_progress
+            or validation.incorrect_value
+            or validation.recently_updated
+        )
+
+    # Skip if there are no required (or recent) updates
+    if not should_report:
+        return ""
 
-    message = ""
+    parts: List[str] = []
 
     # Process each group
     for source_name, oracle_data_list in grouped_data.items():
-        message += f"\n{source_name}:\n"
-        message += "```solidity\n"
+        parts.append(f"\n{source_name}:\n")
+        parts.append("```solidity\n")
         for oracle_data in oracle_data_list:
-            message += f"- {oracle_data.name}: "
+            parts.append(f"- {oracle_data.name}: ")
             if oracle_data.validation is not None:
                 validation = oracle_data.validation
                 if validation.transfer_in_progress:
-                    message += f"ℹ️ OFT transfers in progress (remaining time: {format_remaining_time(validation.remaining_time)}, address: {validation.oracle_address})"
+                    parts.append(
+                        f"ℹ️ OFT transfers in progress (remaining time: {format_remaining_time(validation.remaining_time)}, address: {validation.oracle_address})"
+                    )
                 elif validation.almost_expired:
                     if validation.remaining_time < 0:
-                        message += f"⚠️ Already expired, needs update (overdue: {format_remaining_time(-validation.remaining_time)}, oracle value: {validation.oracle_value}, actual value: {validation.actual_value}, address: {validation.oracle_address})"
+                        parts.append(
+                            f"⚠️ Already expired, needs update (overdue: {format_remaining_time(-validation.remaining_time)}, oracle value: {validation.oracle_value}, actual value: {validation.actual_value}, address: {validation.oracle_address})"
+                        )
                     else:
-                        message += f"⚠️ Almost expired, needs update (remaining time: {format_remaining_time(validation.remaining_time)}, oracle value: {validation.oracle_value}, actual value: {validation.actual_value}, address: {validation.oracle_address})"
+                        parts.append(
+                            f"⚠️ Almost expired, needs update (remaining time: {format_remaining_time(validation.remaining_time)}, oracle value: {validation.oracle_value}, actual value: {validation.actual_value}, address: {validation.oracle_address})"
+                        )
                 elif validation.incorrect_value:
-                    message += f"⚠️ Incorrect value, needs update (remaining time: {format_remaining_time(validation.remaining_time)}, oracle value: {validation.oracle_value}, actual value: {validation.actual_value}, address: {validation.oracle_address})"
+                    parts.append(
+                        f"⚠️ Incorrect value, needs update (remaining time: {format_remaining_time(validation.remaining_time)}, oracle value: {validation.oracle_value}, actual value: {validation.actual_value}, address: {validation.oracle_address})"
+                    )
                 else:
-                    message += f"✅ Up to date (remaining time: {format_remaining_time(validation.remaining_time)})"
+                    parts.append(
+                        f"✅ Up to date (remaining time: {format_remaining_time(validation.remaining_time)})"
+                    )
             else:
-                message += f"❌ Error during validation (RPC problem)"
-            message += "\n"
-        message += "```"
+                parts.append(f"❌ Error during validation (RPC problem)")
+            parts.append("\n")
+        parts.append("```")
 
-    return message
+    return "".join(parts)
 
 
 def compose_safe_proposal_message(
@@ -183,37 +196,39 @@ def compose_safe_proposal_message(
     safe_global: SafeGlobal,
     proposal: SafeProposal,
 ) -> str:
-    message = f"Approve tx for `{source_name}` to update {len(proposal.deployment_names)} oracle(s):\n"
+    parts = [
+        f"Approve tx for `{source_name}` to update {len(proposal.deployment_names)} oracle(s):\n"
+    ]
 
     if proposal.transaction is None:
-        message += "❌ Error occurred during proposal"
-        return message
+        parts.append("❌ Error occurred during proposal")
+        return "".join(parts)
 
-    message += "```solidity\n"
+    parts.append("```solidity\n")
     for index, call in enumerate(proposal.calls):
         name = proposal.deployment_names[index]
         oracle_address = call[0]
         args = call[1]
         args_str = ", ".join(str(arg) for arg in args)
-        message += (
+        parts.append(
             f"- {name}: {proposal.method}({args_str}), address: {oracle_address}\n"
         )
-    message += "```"
+    parts.append("```")
 
     link = compose_safe_tx_link(safe_global, proposal)
-    message += f"\nLink: [{link}]({link})\n"
+    parts.append(f"\nLink: [{link}]({link})\n")
 
     confirmations_message, is_confirmed = compose_safe_tx_confirmations(proposal)
-    message += f"\n{confirmations_message}"
+    parts.append(f"\n{confirmations_message}")
 
     if not is_confirmed:
         mentions = compose_owner_mentions(nickname_address_map, proposal)
         if mentions:
-            message += f", cc {mentions}"
+            parts.append(f", cc {mentions}")
     else:
-        message += " ✅, ready to be executed"
+        parts.append(" ✅, ready to be executed")
 
-    return message
+    return "".join(parts)
 
 
 def compose_safe_tx_link(
@@ -230,10 +245,15 @@ def compose_owner_mentions(
     nickname_address_map: Dict[str, str],
     proposal: SafeProposal,
 ) -> str:
-    owners = []
-    for nickname, address in nickname_address_map.items():
-        if address in proposal.transaction.missing_confirmations:
-            owners.append(nickname)
+    # Configured addresses may be lowercase while the Safe APIs return checksummed ones
+    missing_confirmations = {
+        address.lower() for address in proposal.transaction.missing_confirmations
+    }
+    owners = [
+        nickname
+        for nickname, address in nickname_address_map.items()
+        if address.lower() in missing_confirmations
+    ]
     return format_mentions(owners)
 
 
@@ -253,7 +273,8 @@ def compose_safe_tx_confirmations(proposal: SafeProposal) -> tuple[str, bool]:
 def propose_tx_to_update_oracle(
     oracle_validation_results: List[Tuple[SourceConfig, OracleData]],
 ) -> List[Tuple[SourceConfig, SafeGlobal, SafeProposal]]:
-    result: List[Tuple[SourceConfig, SafeGlobal, SafeProposal]] = []
+    contract_abi = "Oracle"
+    method = "setValue"
 
     # Group validation results by effective Safe identity (chain prefix + address)
     # Key: (eip_3770, safe_address) -> List of oracle data that share the same Safe
@@ -272,7 +293,8 @@ def propose_tx_to_update_oracle(
         safe_global_map[key] = effective_safe
         source_map.setdefault(key, source)
 
-    # Process each Safe group
+    # Collect the calls for each Safe group
+    pending = []
     for (safe_eip_3770, safe_address), oracle_data_list in grouped_data.items():
         safe_global = safe_global_map[(safe_eip_3770, safe_address)]
         source = source_map[(safe_eip_3770, safe_address)]
@@ -283,8 +305,6 @@ def propose_tx_to_update_oracle(
             )
             continue
 
-        contract_abi = "Oracle"
-        method = "setValue"
         deployment_names = []
         calls: list[tuple[str, list[int]]] = []
 
@@ -315,6 +335,9 @@ def propose_tx_to_update_oracle(
             )
             continue
 
+        pending.append((source, safe_global, safe_address, deployment_names, calls))
+
+    def propose(source, safe_global, safe_address, deployment_names, calls):
         transaction = None
         is_newly_created = False
         try:
@@ -337,20 +360,26 @@ def propose_tx_to_update_oracle(
             transaction=transaction,
             is_newly_created=is_newly_created,
         )
-        result.append((source, safe_global, proposal))
+        return (source, safe_global, proposal)
 
-    return result
+    # Each Safe has its own nonce and queue, so proposals (signing and gateway
+    # round-trips) for different Safes run concurrently, the progress output
+    # of each Safe is printed as one block
+    return run_in_parallel_buffered(*(partial(propose, *args) for args in pending))
 
 
-def validate_oracles(
+async def validate_oracles(
     config: Config,
 ) -> List[Tuple[SourceConfig, OracleData]]:
-    result: List[Tuple[SourceConfig, OracleData]] = []
-    for source in config.sources:
-        for deployment in source.deployments:
-            validation_result: Optional[OracleValidationResult] = None
-            try:
-                oracle_validation_result = run_oracle_validation(
+    # Deployments are independent, overlap their RPC latencies
+    semaphore = asyncio.Semaphore(ORACLE_VALIDATION_CONCURRENCY)
+
+    async def validate(source: SourceConfig, deployment: Deployment) -> OracleData:
+        validation_result: Optional[OracleValidationResult] = None
+        try:
+            async with semaphore:
+                validation_result = await asyncio.to_thread(
+                    run_oracle_validation,
                     source_core_address=deployment.source_core,
                     target_core_address=deployment.target_core,
                     source_rpc=source.rpc,
@@ -360,22 +389,31 @@ def validate_oracles(
                     oracle_expiry_threshold_seconds=config.oracle_expiry_threshold_seconds,
                     oracle_recent_update_threshold_seconds=config.oracle_recent_update_threshold_seconds,
                 )
-                validation_result = oracle_validation_result
-            except Exception as e:
-                error_message = str(e)
-                # Mask source RPC and target RPC URLs that might be in the error
-                masked_error = mask_source_sensitive_data(error_message, source)
-                masked_error = mask_url_credentials(masked_error, config.target_rpc)
-                print(
-                    f"Error validating oracle for source {source.name}: {masked_error}"
-                )
-            oracle_data = OracleData(
-                name=deployment.name,
-                deployment=deployment,
-                validation=validation_result,
-            )
-            result.append((source, oracle_data))
-    return result
+        except Exception as e:
+            error_message = str(e)
+            # Mask source RPC and target RPC URLs that might be in the error
+            masked_error = mask_source_sensitive_data(error_message, source)
+            masked_error = mask_url_credentials(masked_error, config.target_rpc)
+            print(f"Error validating oracle for source {source.name}: {masked_error}")
+        return OracleData(
+            name=deployment.name,
+            deployment=deployment,
+            validation=validation_result,
+        )
+
+    pairs = [
+        (source, deployment)
+        for source in config.sources
+        for deployment in source.deployments
+    ]
+    # Results keep the config order, regardless of completion order
+    oracle_data_list = await asyncio.gather(
+        *(validate(source, deployment) for source, deployment in pairs)
+    )
+    return [
+        (source, oracle_data)
+        for (source, _), oracle_data in zip(pairs, oracle_data_list)
+    ]
 
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
+import orjson
 import requests
+from functools import lru_cache
 from urllib.parse import urljoin
 from safe_eth.safe import SafeTx
 from safe_eth.eth import EthereumClient
@@ -10,13 +12,18 @@ from safe_global.common import (
     retry_with_backoff,
 )
 
+# Reuse connections to the gateway instead of a new TLS handshake per call
+_session = requests.Session()
 
+
+# The service behind an API URL does not change while the bot runs
+@lru_cache(maxsize=None)
 def get_version(api_url: str) -> str:
     url = urljoin(api_url, "/about")
-    response = requests.get(url, headers={"Accept": "application/json"})
+    response = _session.get(url, headers={"Accept": "application/json"})
     if response.status_code != 200:
         raise Exception(f"Failed to get client gateway version: {response.status_code}")
-    result = response.json()
+    result = orjson.loads(response.content)
     if result["name"] != "safe-client-gateway":
         raise Exception(f"Provided API URL is not a client gateway: {api_url}")
     return result["version"]
@@ -26,12 +33,12 @@ def get_nonce(api_url: str, chainId: int, safe_address: str) -> int:
     url = urljoin(api_url, f"/v1/chains/{chainId}/safes/{safe_address}/nonces")
 
     def fetch_nonce():
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = _session.get(url, headers={"Accept": "application/json"})
         if response.status_code != 200:
             raise Exception(
                 f"Failed to get nonces: {response.status_code} - {response.text}"
             )
-        return response.json()["currentNonce"]
+        return orjson.loads(response.content)["currentNonce"]
 
     return retry_with_backoff(fetch_nonce)
 
@@ -60,12 +67,14 @@ def propose_safe_tx(api_url: str, safe_tx: SafeTx) -> str:
     }
 
     def propose():
-        response = requests.post(url, headers=headers, json=body, timeout=15)
+        response = _session.post(
+            url, headers=headers, data=orjson.dumps(body), timeout=15
+        )
         if response.status_code != 200:
             raise Exception(
                 f"Failed to propose safe tx: {response.status_code} - {response.text}"
             )
-        return response.json()
+        return orjson.loads(response.content)
 
     response_data = retry_with_backoff(propose, max_attempts=3, backoff_factor=2.0)
 
@@ -93,12 +102,12 @@ def _get_queued_transactions(api_url: str, chainId: int, safe_address: str):
     )
 
     def fetch():
-        response = requests.get(url, headers={"Accept": "application/json"}, timeout=10)
+        response = _session.get(url, headers={"Accept": "application/json"}, timeout=10)
         if response.status_code != 200:
             raise Exception(
                 f"Failed to get queued transactions: {response.status_code} - {response.text}"
             )
-        results = response.json()["results"]
+        results = orjson.loads(response.content)["results"]
         return [result for result in results if result.get("type") == "TRANSACTION"]
 
     return retry_with_backoff(fetch, max_attempts=5, backoff_factor=2.0)
@@ -198,13 +207,13 @@ def _get_owners_and_threshold(
     headers = {"Accept": "application/json"}
 
     def fetch():
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _session.get(url, headers=headers, timeout=10)
         if response.status_code != 200:
             raise Exception(
                 f"Failed to get Safe info: {response.status_code} - {response.text}"
             )
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         threshold = data.get("threshold")
         owners_data = data.get("owners", [])
@@ -279,10 +288,9 @@ def get_queued_transaction(
     missing_confirmations = [signer["value"] for signer in missing_signers_data]
 
     # Calculate confirmed owners by finding the difference between all owners and missing ones
+    missing_owners = set(missing_confirmations)
     confirmations = [
-        owner
-        for owner in threshold_with_owners.owners
-        if owner not in missing_confirmations
+        owner for owner in threshold_with_owners.owners if owner not in missing_owners
     ]
 
     # Validate transaction id
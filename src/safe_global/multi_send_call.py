@@ -1,7 +1,7 @@
 from typing import List, Optional
 from web3 import Web3, constants
 
-from web3_scripts import get_contract, get_w3
+from web3_scripts import get_contract, get_w3, OFFLINE_W3
 
 # Multi-send contract addresses for different versions
 # https://docs.safe.global/advanced/smart-account-supported-networks?expand=1&page=2
@@ -46,8 +46,9 @@ def encode_multi(calls: List[tuple[str, str]]) -> str:
 
     calls_encoded = "0x" + "".join(encoded_calls)
 
-    w3 = Web3()
-    contract = get_contract(w3, address=constants.ADDRESS_ZERO, name="SafeMultiSend")
+    contract = get_contract(
+        OFFLINE_W3, address=constants.ADDRESS_ZERO, name="SafeMultiSend"
+    )
     data = contract.encode_abi("multiSend", [bytes.fromhex(calls_encoded[2:])])
 
     return data
@@ -7,12 +7,20 @@ from . import client_gateway_api, transaction_api
 from .multi_send_call import encode_multi, resolve_multi_send_contract
 from .common import PendingTransactionInfo
 
-from web3_scripts import get_contract, print_colored, get_w3
+from web3_scripts import (
+    get_contract,
+    print_colored,
+    get_w3,
+    get_chain_id,
+    OFFLINE_W3,
+)
 from config import SourceConfig, SafeGlobal
 
 
 def _create_calldata(contract_name: str, method: str, args: list) -> str:
-    contract = get_contract(Web3(), address=constants.ADDRESS_ZERO, name=contract_name)
+    contract = get_contract(
+        OFFLINE_W3, address=constants.ADDRESS_ZERO, name=contract_name
+    )
     calldata = contract.encode_abi(method, args)
     return calldata
 
@@ -56,7 +64,18 @@ def _create_signed_safe_tx_for_safe(
     return safe_tx
 
 
+# (api_url, api_key) -> whether it is a transaction API, resolved once per process
+_api_types = {}
+
+
 def _is_transaction_api(safe: SafeGlobal) -> bool:
+    key = (safe.api_url, safe.api_key)
+    if key not in _api_types:
+        _api_types[key] = _resolve_api_type(safe)
+    return _api_types[key]
+
+
+def _resolve_api_type(safe: SafeGlobal) -> bool:
     try:
         transaction_api.get_version(safe.api_url, safe.api_key)
         return True
@@ -89,7 +108,7 @@ def _get_queued_transaction_for_safe(
     to: str, calldata: str, rpc: str, safe_global: SafeGlobal
 ) -> PendingTransactionInfo:
     w3 = get_w3(rpc)
-    chain_id = w3.eth.chain_id
+    chain_id = get_chain_id(w3)
     safe_contract = get_contract(w3, address=safe_global.safe_address, name="Safe")
     api_url = safe_global.api_url
     api_key = safe_global.api_key
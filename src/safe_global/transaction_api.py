@@ -1,4 +1,5 @@
 import requests
+from functools import lru_cache
 from safe_eth.safe import SafeTx
 from safe_global.common import (
     ThresholdWithOwners,
@@ -9,6 +10,8 @@ from safe_global.common import (
 )
 
 
+# The service behind an API URL does not change while the bot runs
+@lru_cache(maxsize=None)
 def get_version(api_url: str, api_key: str) -> str:
     url = f"{api_url.rstrip('/')}/api/v1/about"
     headers = {"Accept": "application/json", "Authorization": f"Bearer {api_key}"}
@@ -163,8 +166,9 @@ def get_queued_transaction(
     confirmations = [conf["owner"] for conf in transaction.get("confirmations", [])]
 
     # Calculate missing confirmations (owners who haven't confirmed yet)
+    confirmed_owners = set(confirmations)
     missing_confirmations = [
-        owner for owner in threshold_with_owners.owners if owner not in confirmations
+        owner for owner in threshold_with_owners.owners if owner not in confirmed_owners
     ]
 
     # Create compound ID as specified
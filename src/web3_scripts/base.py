@@ -1,45 +1,368 @@
+import io
 import json
+import os
+import sys
+import threading
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 from web3.contract import Contract
 from eth_account import Account
 from web3.middleware import ExtraDataToPOAMiddleware
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from eth_utils.abi import get_abi_output_types
 
 
 BLOCK_GAP = 10000
 SECURE_INTERVAL = 5 * 60  # 5 minutes
+LAYER_ZERO_DUST = 1000_000_000_000
+BLOCK_SEARCH_BUCKET = 60  # seconds
+
+RPC_TIMEOUT = 20  # seconds
+RECEIPT_POLL_LATENCY = 1  # seconds, web3 default of 0.1s floods the RPC while waiting
+# Same address on all supported chains: https://www.multicall3.com/deployments
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+COLORS = {"red": "\033[31m", "green": "\033[32m", "yellow": "\033[33m"}
+RESET_COLOR = "\033[0m"
+
+# Provider-less instance for ABI encoding only, it never sends requests
+OFFLINE_W3 = Web3()
 
 
 def add_color(text: str, color="yellow") -> str:
-    if color == "red":
-        text = "\033[31m" + text + "\033[0m"
-    elif color == "green":
-        text = "\033[32m" + text + "\033[0m"
-    elif color == "yellow":
-        text = "\033[33m" + text + "\033[0m"
-    return text
+    # Set NO_COLOR (https://no-color.org) to print without ANSI escape codes, e.g. when logging to files.
+    # Not tied to isatty() since GitHub Actions renders colors but is not a TTY.
+    # Read on every call, main.py loads .env after this module is imported.
+    if color not in COLORS or os.getenv("NO_COLOR"):
+        return text
+    return COLORS[color] + text + RESET_COLOR
 
 
 def print_colored(text: str, color="yellow") -> str:
     print(add_color(text, color))
 
 
+def _create_rpc_session() -> requests.Session:
+    # JSON-RPC goes over POST, so only retry failures where the request was not processed:
+    # connection errors and 429/503 responses. Read errors are not retried to avoid
+    # re-sending a transaction that may already have been accepted.
+    retry = Retry(
+        total=5,
+        connect=5,
+        read=0,
+        status=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 503],
+        allowed_methods=["POST"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
 def get_w3(rpc: str) -> Web3:
-    w3 = Web3(Web3.HTTPProvider(rpc))
+    # One instance per RPC, so deployments sharing an RPC reuse its keep-alive connections
+    w3 = Web3(
+        Web3.HTTPProvider(
+            rpc,
+            request_kwargs={"timeout": RPC_TIMEOUT},
+            session=_create_rpc_session(),
+            # The validation middleware fetches eth_chainId around every request
+            cache_allowed_requests=True,
+            cacheable_requests={"eth_chainId"},
+        )
+    )
     w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
     return w3
 
 
-def get_contract(w3: Web3, address: str, name: str) -> Contract:
+@lru_cache(maxsize=None)
+def get_chain_id(w3: Web3) -> int:
+    # The provider request cache is per thread, the chain id of an endpoint never changes
+    return w3.eth.chain_id
+
+
+@lru_cache(maxsize=None)
+def _load_abi(name: str) -> list:
     with open("./abi/{}.json".format(name), "r") as f:
-        abi = json.load(f)
-        return w3.eth.contract(address=w3.to_checksum_address(address), abi=abi)
+        return json.load(f)
+
+
+@lru_cache(maxsize=1024)
+def _checksum(address: str) -> str:
+    return Web3.to_checksum_address(address)
+
+
+@lru_cache(maxsize=256)
+def get_contract(w3: Web3, address: str, name: str) -> Contract:
+    return w3.eth.contract(address=_checksum(address), abi=_load_abi(name))
+
+
+@dataclass(frozen=True)
+class PreparedCall:
+    """
+    Contract function call with calldata encoded once, reusable across blocks and polls.
+    """
+
+    address: str
+    data: str
+    output_types: tuple
+    function: str = "call"
+
+    def __str__(self) -> str:
+        return f"{self.function}() on {self.address}"
+
+
+def prepare_call(call) -> PreparedCall:
+    if isinstance(call, PreparedCall):
+        return call
+    return PreparedCall(
+        address=call.address,
+        data=call._encode_transaction_data(),
+        output_types=tuple(get_abi_output_types(call.abi)),
+        function=call.fn_name,
+    )
+
+
+@lru_cache(maxsize=1024)
+def bound_call(functions, name: str, *args) -> PreparedCall:
+    """
+    Memoized prepare_call(functions.<name>(*args)) for reads repeated with the same
+    arguments across runs and polls. Arguments must be hashable.
+    """
+    return prepare_call(getattr(functions, name)(*args))
+
+
+def _decode_call_result(w3: Web3, prepared: PreparedCall, return_data: bytes):
+    try:
+        values = map_abi_data(
+            BASE_RETURN_NORMALIZERS,
+            prepared.output_types,
+            w3.codec.decode(prepared.output_types, return_data),
+        )
+    except Exception as e:
+        # Typically empty return data of an address without code
+        raise Exception(f"Failed to decode result of {prepared}: {e}") from e
+    return values[0] if len(values) == 1 else values
+
+
+def _collect_results(tasks: list, allow_failure: bool) -> list:
+    results = []
+    for task in tasks:
+        try:
+            results.append(task())
+        except Exception as e:
+            if not allow_failure:
+                raise
+            results.append(e)
+    return results
+
+
+def call_prepared(w3: Web3, call, block_identifier="latest"):
+    """
+    Same as ContractFunction.call(), but skips ABI binding and encoding for prepared calls.
+    """
+    prepared = prepare_call(call)
+    try:
+        return_data = w3.eth.call(
+            {"to": prepared.address, "data": prepared.data}, block_identifier
+        )
+    except Exception as e:
+        raise Exception(f"Call to {prepared} failed: {e}") from e
+    return _decode_call_result(w3, prepared, return_data)
+
+
+def batch_call(
+    w3: Web3, calls: list, block_identifier="latest", allow_failure=False
+) -> list:
+    """
+    Execute contract function calls against a single chain in one JSON-RPC batch.
+    All calls are pinned to the same block, results are returned in the same order.
+    With allow_failure, a failed call is returned as its exception instead of raised.
+    """
+    prepared_calls = [prepare_call(call) for call in calls]
+    try:
+        with w3.batch_requests() as batch:
+            for prepared in prepared_calls:
+                batch.add(
+                    w3.eth.call(
+                        {"to": prepared.address, "data": prepared.data},
+                        block_identifier,
+                    )
+                )
+            results = batch.execute()
+    except Exception:
+        # A batch fails as a whole, repeat the calls one by one to tell which one failed
+        return _collect_results(
+            [partial(call_prepared, w3, p, block_identifier) for p in prepared_calls],
+            allow_failure,
+        )
+    return _collect_results(
+        [
+            partial(_decode_call_result, w3, prepared, return_data)
+            for prepared, return_data in zip(prepared_calls, results)
+        ],
+        allow_failure,
+    )
+
+
+@lru_cache(maxsize=None)
+def _has_multicall3(w3: Web3) -> bool:
+    return len(w3.eth.get_code(MULTICALL3_ADDRESS)) > 0
+
+
+def _decode_aggregate3_result(
+    w3: Web3, prepared: PreparedCall, success: bool, return_data: bytes
+):
+    if not success:
+        raise Exception(f"Call to {prepared} reverted")
+    return _decode_call_result(w3, prepared, return_data)
+
+
+def multicall(
+    w3: Web3, calls: list, block_identifier="latest", allow_failure=False
+) -> list:
+    """
+    Execute contract function calls against a single chain in one eth_call via Multicall3.
+    Accepts contract functions or prepared calls, results are decoded the same way as
+    call() would, in the same order as calls.
+    A failed call raises an error naming its function and address, with allow_failure
+    it is returned as that exception instead, so the other results stay usable.
+    Falls back to a JSON-RPC batch on chains without Multicall3.
+    """
+    if not calls:
+        return []
+    if not _has_multicall3(w3):
+        return batch_call(
+            w3, calls, block_identifier=block_identifier, allow_failure=allow_failure
+        )
+
+    prepared_calls = [prepare_call(call) for call in calls]
+    multicall3 = get_contract(w3, MULTICALL3_ADDRESS, "Multicall3")
+    # Failures are always allowed on-chain, so a revert can be attributed to its call
+    results = multicall3.functions.aggregate3(
+        [(prepared.address, True, prepared.data) for prepared in prepared_calls]
+    ).call(block_identifier=block_identifier)
+    return _collect_results(
+        [
+            partial(_decode_aggregate3_result, w3, prepared, success, return_data)
+            for prepared, (success, return_data) in zip(prepared_calls, results)
+        ],
+        allow_failure,
+    )
+
+
+def run_in_parallel(
+    *tasks: Callable[[], Any], max_workers: Optional[int] = None
+) -> list:
+    """
+    Run independent I/O-bound tasks (e.g. reads from different chains) in threads,
+    at most max_workers at a time (one thread per task by default).
+    Results are returned in the same order as tasks, the first failure is re-raised.
+    """
+    if not tasks:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers or len(tasks), len(tasks))
+    ) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        return [future.result() for future in futures]
+
+
+class _ThreadBufferedStdout(threading.local):
+    """
+    Stdout replacement that collects writes of threads with a buffer set,
+    so the output of tasks run concurrently does not interleave.
+    """
+
+    def __init__(self, stdout):
+        self.stdout = stdout
+        self.buffer = None
+
+    def write(self, text: str) -> int:
+        if self.buffer is not None:
+            return self.buffer.write(text)
+        return self.stdout.write(text)
+
+    def flush(self):
+        self.stdout.flush()
+
+
+def run_in_parallel_buffered(
+    *tasks: Callable[[], Any], max_workers: Optional[int] = None
+) -> list:
+    """
+    Same as run_in_parallel, but the stdout of each task is collected and printed
+    in task order once all tasks are done, so multi-line progress output stays readable.
+    The first failure is re-raised after printing the output of the tasks before it.
+    """
+    stdout = sys.stdout
+    buffered_stdout = _ThreadBufferedStdout(stdout)
+
+    def run(task: Callable[[], Any]):
+        buffered_stdout.buffer = io.StringIO()
+        try:
+            result = task()
+            return buffered_stdout.buffer.getvalue(), result, None
+        except Exception as e:
+            return buffered_stdout.buffer.getvalue(), None, e
+        finally:
+            buffered_stdout.buffer = None
+
+    sys.stdout = buffered_stdout
+    try:
+        outcomes = run_in_parallel(
+            *(partial(run, task) for task in tasks), max_workers=max_workers
+        )
+    finally:
+        sys.stdout = stdout
+
+    results = []
+    for output, result, error in outcomes:
+        stdout.write(output)
+        if error:
+            raise error
+        results.append(result)
+    return results
 
 
 def execute(contractFunction, value: int, operator_pk: str):
     operator_address = Account.from_key(operator_pk).address
     w3 = contractFunction.w3
 
-    operator_balance = w3.eth.get_balance(operator_address)
+    def fetch_max_priority_fee() -> int:
+        try:
+            return min(w3.eth.max_priority_fee * 3, w3.to_wei(10, "gwei"))
+        except:
+            return w3.to_wei(2, "gwei")
+
+    def estimate_gas() -> int:
+        return (
+            contractFunction.estimate_gas({"from": operator_address, "value": value})
+            * 105
+            // 100
+        )
+
+    # Pre-flight reads are independent, run them concurrently and check them in order
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        balance_future = executor.submit(w3.eth.get_balance, operator_address)
+        latest_block_future = executor.submit(w3.eth.get_block, "latest")
+        max_priority_fee_future = executor.submit(fetch_max_priority_fee)
+        gas_future = executor.submit(estimate_gas)
+        nonce_future = executor.submit(w3.eth.get_transaction_count, operator_address)
+
+    operator_balance = balance_future.result()
     if operator_balance < value:
         raise Exception(
             "Operator balance is too low: {}. Required for LayerZero payment: {}".format(
@@ -47,20 +370,11 @@ def execute(contractFunction, value: int, operator_pk: str):
             )
         )
 
-    base_fee = w3.eth.get_block("latest").baseFeePerGas * 105 // 100
-    try:
-        max_priority_fee = min(w3.eth.max_priority_fee * 3, w3.to_wei(10, "gwei"))
-    except:
-        max_priority_fee = w3.to_wei(2, "gwei")
+    base_fee = latest_block_future.result().baseFeePerGas * 105 // 100
+    max_priority_fee = max_priority_fee_future.result()
 
     try:
-        gas = (
-            contractFunction.estimate_gas(
-                {"from": Web3.to_checksum_address(operator_address), "value": value}
-            )
-            * 105
-            // 100
-        )
+        gas = gas_future.result()
     except Exception as e:
         raise Exception("Gas estimation failed: {}".format(e))
 
@@ -81,45 +395,102 @@ def execute(contractFunction, value: int, operator_pk: str):
             "maxPriorityFeePerGas": max_priority_fee,
             "value": value,
             "from": operator_address,
-            "nonce": w3.eth.get_transaction_count(operator_address),
+            "nonce": nonce_future.result(),
         }
     )
     signed_txn = w3.eth.account.sign_transaction(transaction, private_key=operator_pk)
     tx = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
     print("Transaction sent: {}".format(tx.hex()))
-    receipt = w3.eth.wait_for_transaction_receipt(tx)
+    receipt = w3.eth.wait_for_transaction_receipt(tx, poll_latency=RECEIPT_POLL_LATENCY)
     print(
         "Transaction mined in block: {}. Chain id: {}".format(
-            receipt.blockNumber, w3.eth.chain_id
+            receipt.blockNumber, get_chain_id(w3)
         )
     )
 
 
-def get_block_before_timestamp(w3: Web3, timestamp: int) -> int:
-    latest_block = w3.eth.get_block("latest")
+def get_withdrawal_demand(source_value: int, target_value: int, withdrawal_data) -> int:
+    """
+    Convert the pending withdrawal shares from SourceHelper.getWithdrawalData into assets.
+    """
+    withdrawal_shares, total_supply = withdrawal_data
+    return (source_value + target_value) * withdrawal_shares // total_supply
+
+
+def round_up_to_layer_zero_dust(amount: int) -> int:
+    return (amount // LAYER_ZERO_DUST + 1) * LAYER_ZERO_DUST
+
+
+def get_block_before_timestamp(w3: Web3, timestamp: int, latest_block=None) -> int:
+    """
+    Find the latest block with block.timestamp <= timestamp.
+    Starts from a block time based estimate and bisects a bracketing window around it.
+    An already fetched latest block can be passed to save a request.
+    """
+    timestamps = {}
+
+    def get_timestamp(block_number: int) -> int:
+        if block_number not in timestamps:
+            timestamps[block_number] = w3.eth.get_block(block_number).timestamp
+        return timestamps[block_number]
+
+    if latest_block is None:
+        latest_block = w3.eth.get_block("latest")
+    timestamps[latest_block.number] = latest_block.timestamp
+    if latest_block.timestamp <= timestamp:
+        return latest_block.number
+
     from_block = w3.eth.get_block(latest_block.number - BLOCK_GAP)
     timespan = latest_block.timestamp - from_block.timestamp
     while timespan == 0:
         from_block = w3.eth.get_block(from_block.number - BLOCK_GAP)
         timespan = latest_block.timestamp - from_block.timestamp
+    timestamps[from_block.number] = from_block.timestamp
     seconds_per_block = timespan / (latest_block.number - from_block.number)
     block_number_estimate = latest_block.number - int(
         (latest_block.timestamp - timestamp) / seconds_per_block
     )
-    block_number_estimate = min(latest_block.number, block_number_estimate)
-    block = w3.eth.get_block(block_identifier=block_number_estimate)
-    if block.timestamp > timestamp:
-        while block.timestamp > timestamp:
-            prev_block = w3.eth.get_block(block.number - 1)
-            if prev_block.timestamp <= timestamp:
-                return prev_block.number
-            block = prev_block
-    else:
-        while block.timestamp <= timestamp:
-            if block.number == latest_block.number:
-                return block.number
-            next_block = w3.eth.get_block(block.number + 1)
-            if next_block.timestamp > timestamp:
-                return block.number
-            block = next_block
-    raise Exception("Block not found for timestamp {}".format(timestamp))
+    block_number_estimate = max(0, min(latest_block.number, block_number_estimate))
+
+    # Widen the window until get_timestamp(low) <= timestamp < get_timestamp(high)
+    window = max(BLOCK_GAP // 10, 256)
+    low = max(0, block_number_estimate - window)
+    high = min(latest_block.number, block_number_estimate + window)
+    while get_timestamp(low) > timestamp:
+        if low == 0:
+            raise Exception("Block not found for timestamp {}".format(timestamp))
+        high = low
+        window *= 2
+        low = max(0, block_number_estimate - window)
+    while get_timestamp(high) <= timestamp:
+        low = high
+        window *= 2
+        high = min(latest_block.number, block_number_estimate + window)
+
+    while high - low > 1:
+        middle = (low + high) // 2
+        if get_timestamp(middle) <= timestamp:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+# (w3, bucket timestamp) -> block number, shared by deployments on the same chain
+_blocks_before_timestamp = {}
+
+
+def get_cached_block_before_timestamp(
+    w3: Web3, timestamp: int, latest_block=None
+) -> int:
+    """
+    Same as get_block_before_timestamp, with timestamp rounded down to BLOCK_SEARCH_BUCKET
+    so that nearby lookups on the same chain share a single block search.
+    """
+    bucket_timestamp = timestamp - timestamp % BLOCK_SEARCH_BUCKET
+    key = (w3, bucket_timestamp)
+    if key not in _blocks_before_timestamp:
+        _blocks_before_timestamp[key] = get_block_before_timestamp(
+            w3, bucket_timestamp, latest_block=latest_block
+        )
+    return _blocks_before_timestamp[key]
@@ -6,7 +6,8 @@ except ImportError:
     from oracle_script import run_oracle_validation
 import time
 
-LAYER_ZERO_DUST = 1000_000_000_000
+LAYER_ZERO_POLL_INITIAL_DELAY = 10  # seconds
+LAYER_ZERO_POLL_MAX_DELAY = 60  # seconds
 
 
 def wait_for_layer_zero_finalization(
@@ -15,16 +16,25 @@ def wait_for_layer_zero_finalization(
     source_core_address: str,
     target_core_address: str,
 ) -> None:
+    source_nonces_call = bound_call(source_helper, "getNonces", source_core_address)
+    target_nonces_call = bound_call(target_helper, "getNonces", target_core_address)
+    source_w3 = source_helper.w3
+    target_w3 = target_helper.w3
+
     iteration = 1
-    time.sleep(60)
+    delay = LAYER_ZERO_POLL_INITIAL_DELAY
+    time.sleep(delay)
     while True:
-        source_nonces = source_helper.getNonces(source_core_address).call()
-        target_nonces = target_helper.getNonces(target_core_address).call()
+        source_nonces, target_nonces = run_in_parallel(
+            lambda: call_prepared(source_w3, source_nonces_call),
+            lambda: call_prepared(target_w3, target_nonces_call),
+        )
         # requirement: source.inboundNonce == target.outboundNonce && source.outboundNonce == target.inboundNonce
         if source_nonces[0] != target_nonces[1] or source_nonces[1] != target_nonces[0]:
             print("Waiting for LayerZero finalization ({})...".format(iteration))
             iteration += 1
-            time.sleep(60)
+            delay = min(LAYER_ZERO_POLL_MAX_DELAY, delay * 1.5)
+            time.sleep(delay)
         else:
             time.sleep(15)
             break
@@ -78,15 +88,31 @@ def run(
     source_core = get_contract(source_w3, source_core_address, "SourceCore").functions
     target_core = get_contract(target_w3, target_core_address, "TargetCore").functions
 
-    source_block = source_w3.eth.get_block("latest").number
-    target_block = target_w3.eth.get_block("latest").number
+    # Source and target chains are independent endpoints, query them concurrently
+    def fetch_source_state():
+        return multicall(
+            source_w3,
+            [
+                bound_call(source_helper, "getNonces", source_core_address),
+                bound_call(source_helper, "getSourceValue", source_core_address),
+                bound_call(source_helper, "getWithdrawalData", source_core_address),
+            ],
+            block_identifier=source_w3.eth.block_number,
+        )
 
-    source_nonces = source_helper.getNonces(source_core_address).call(
-        block_identifier=source_block
-    )
-    target_nonces = target_helper.getNonces(target_core_address).call(
-        block_identifier=target_block
-    )
+    def fetch_target_state():
+        return multicall(
+            target_w3,
+            [
+                bound_call(target_helper, "getNonces", target_core_address),
+                bound_call(target_helper, "getTargetValue", target_core_address),
+            ],
+            block_identifier=target_w3.eth.block_number,
+        )
+
+    source_state, target_state = run_in_parallel(fetch_source_state, fetch_target_state)
+    source_nonces, source_value, withdrawal_data = source_state
+    target_nonces, target_value = target_state
     # requirement: source.inboundNonce == target.outboundNonce && source.outboundNonce == target.inboundNonce
     if source_nonces[0] != target_nonces[1] or source_nonces[1] != target_nonces[0]:
         print_colored(
@@ -97,19 +123,8 @@ def run(
         )
         return
 
-    source_value = source_helper.getSourceValue(source_core_address).call(
-        block_identifier=source_block
-    )
-    target_value = target_helper.getTargetValue(target_core_address).call(
-        block_identifier=target_block
-    )
-    withdrawal_data = source_helper.getWithdrawalData(source_core_address).call(
-        block_identifier=source_block
-    )
-    withdrawal_demand = withdrawal_data[0]
-    total_supply = withdrawal_data[1]
-    withdrawal_demand = (
-        (source_value + target_value) * withdrawal_demand // total_supply
+    withdrawal_demand = get_withdrawal_demand(
+        source_value, target_value, withdrawal_data
     )
 
     if source_value + target_value <= withdrawal_demand:
@@ -131,8 +146,7 @@ def run(
     )
 
     if force_withdrawal:
-        assets_deficit = target_value
-        assets_deficit = (assets_deficit // LAYER_ZERO_DUST + 1) * LAYER_ZERO_DUST
+        assets_deficit = round_up_to_layer_zero_dust(target_value)
         print("Assets deficit: {}.".format(assets_deficit))
         data = target_helper.getAmounts(target_core_address, assets_deficit).call()
         if data[2] > 0:
@@ -162,7 +176,7 @@ def run(
             * (source_value + target_value - withdrawal_demand)
             // 1000
         )
-        assets_deficit = (assets_deficit // LAYER_ZERO_DUST + 1) * LAYER_ZERO_DUST
+        assets_deficit = round_up_to_layer_zero_dust(assets_deficit)
         print(
             "Assets deficit: {}. Current ratio: {}%".format(
                 assets_deficit, current_ratio_d3 / 10
@@ -313,14 +327,14 @@ if __name__ == "__main__":
     print(f"Source Ratio D3: {add_color(str(source_ratio_d3), 'yellow')}")
     print(f"Max Source Ratio D3: {add_color(str(max_source_ratio_d3), 'yellow')}")
     print(
-        f"Target chain ID: {add_color(str(get_w3(config.target_rpc).eth.chain_id), 'yellow')}"
+        f"Target chain ID: {add_color(str(get_chain_id(get_w3(config.target_rpc))), 'yellow')}"
     )
     print("\nDeployments:")
 
     source_chain_ids = {}
     for source, deployment in deployments:
         if source.name not in source_chain_ids:
-            source_chain_ids[source.name] = get_w3(source.rpc).eth.chain_id
+            source_chain_ids[source.name] = get_chain_id(get_w3(source.rpc))
         print(f"- {source.name} ({source_chain_ids[source.name]}): {deployment.name}")
         print(f"\tSource Core Helper: {add_color(source.source_core_helper, 'yellow')}")
         print(f"\tSource Core: {add_color(deployment.source_core, 'yellow')}")
@@ -6,8 +6,6 @@ except ImportError:
     from oracle_script import run_oracle_validation
 from typing import List
 
-LAYER_ZERO_DUST = 1000_000_000_000
-
 
 def run(
     source_core_address: str,
@@ -56,15 +54,31 @@ def run(
     source_core = get_contract(source_w3, source_core_address, "SourceCore").functions
     target_core = get_contract(target_w3, target_core_address, "TargetCore").functions
 
-    source_block = source_w3.eth.get_block("latest").number
-    target_block = target_w3.eth.get_block("latest").number
+    # Source and target chains are independent endpoints, query them concurrently
+    def fetch_source_state():
+        return multicall(
+            source_w3,
+            [
+                bound_call(source_helper, "getNonces", source_core_address),
+                bound_call(source_helper, "getSourceValue", source_core_address),
+                bound_call(source_helper, "getWithdrawalData", source_core_address),
+            ],
+            block_identifier=source_w3.eth.block_number,
+        )
 
-    source_nonces = source_helper.getNonces(source_core_address).call(
-        block_identifier=source_block
-    )
-    target_nonces = target_helper.getNonces(target_core_address).call(
-        block_identifier=target_block
-    )
+    def fetch_target_state():
+        return multicall(
+            target_w3,
+            [
+                bound_call(target_helper, "getNonces", target_core_address),
+                bound_call(target_helper, "getTargetValue", target_core_address),
+            ],
+            block_identifier=target_w3.eth.block_number,
+        )
+
+    source_state, target_state = run_in_parallel(fetch_source_state, fetch_target_state)
+    source_nonces, source_value, withdrawal_data = source_state
+    target_nonces, target_value = target_state
     # requirement: source.inboundNonce == target.outboundNonce && source.outboundNonce == target.inboundNonce
     if source_nonces[0] != target_nonces[1] or source_nonces[1] != target_nonces[0]:
         print_colored(
@@ -75,19 +89,8 @@ def run(
         )
         return []
 
-    source_value = source_helper.getSourceValue(source_core_address).call(
-        block_identifier=source_block
-    )
-    target_value = target_helper.getTargetValue(target_core_address).call(
-        block_identifier=target_block
-    )
-    withdrawal_data = source_helper.getWithdrawalData(source_core_address).call(
-        block_identifier=source_block
-    )
-    withdrawal_demand = withdrawal_data[0]
-    total_supply = withdrawal_data[1]
-    withdrawal_demand = (
-        (source_value + target_value) * withdrawal_demand // total_supply
+    withdrawal_demand = get_withdrawal_demand(
+        source_value, target_value, withdrawal_data
     )
 
     if source_value + target_value <= withdrawal_demand:
@@ -104,8 +107,7 @@ def run(
 
     required_actions = []
     if force_withdrawal:
-        assets_deficit = target_value
-        assets_deficit = (assets_deficit // LAYER_ZERO_DUST + 1) * LAYER_ZERO_DUST
+        assets_deficit = round_up_to_layer_zero_dust(target_value)
         print("Assets deficit: {}.".format(assets_deficit))
         data = target_helper.getAmounts(target_core_address, assets_deficit).call()
         if data[2] > 0:
@@ -130,7 +132,7 @@ def run(
             * (source_value + target_value - withdrawal_demand)
             // 1000
         )
-        assets_deficit = (assets_deficit // LAYER_ZERO_DUST + 1) * LAYER_ZERO_DUST
+        assets_deficit = round_up_to_layer_zero_dust(assets_deficit)
         print(
             "Assets deficit: {}. Current ratio: {}%".format(
                 assets_deficit, current_ratio_d3 / 10
@@ -178,6 +180,7 @@ if __name__ == "__main__":
     import os
     import dotenv
     import sys
+    from functools import partial
     from pathlib import Path
 
     # Add src directory to path to import config module
@@ -212,17 +215,40 @@ if __name__ == "__main__":
                 )
             )
 
+    # Fetch all vault names up front: one aggregated call per source chain, chains in parallel
+    def fetch_source_core_names(source) -> dict:
+        source_w3 = get_w3(source.rpc)
+        names = multicall(
+            source_w3,
+            [
+                get_contract(
+                    source_w3, deployment.source_core, "SourceCore"
+                ).functions.name()
+                for deployment in source.deployments
+            ],
+        )
+        return {
+            deployment.source_core: name
+            for deployment, name in zip(source.deployments, names)
+        }
+
+    source_core_names = {}
+    for names in run_in_parallel(
+        *(
+            partial(fetch_source_core_names, source)
+            for source in config.sources
+            if source.deployments
+        )
+    ):
+        source_core_names.update(names)
+
     for (
         source_core_address,
         target_core_address,
         source_core_helper,
         source_rpc,
     ) in deployments:
-        source_core_name = (
-            get_contract(get_w3(source_rpc), source_core_address, "SourceCore")
-            .functions.name()
-            .call()
-        )
+        source_core_name = source_core_names[source_core_address]
         print(f"Analyzing {add_color(source_core_name, 'yellow')} vault...")
 
         try:
@@ -21,6 +21,22 @@ class OracleValidationResult:
     incorrect_value: bool
 
 
+# (source_rpc, source_core_address) -> oracle address. The oracle is set once at
+# SourceCore initialization, unlike maxAge which the oracle owner can change.
+_oracle_addresses = {}
+
+
+def _get_oracle_address(
+    source_rpc: str, source_core_address: str, source_core, block_identifier
+) -> str:
+    key = (source_rpc, source_core_address)
+    if key not in _oracle_addresses:
+        _oracle_addresses[key] = source_core.oracle().call(
+            block_identifier=block_identifier
+        )
+    return _oracle_addresses[key]
+
+
 def _run_oracle_validation(
     source_core_address: str,
     target_core_address: str,
@@ -42,33 +58,57 @@ def _run_oracle_validation(
     ).functions
 
     source_core = get_contract(source_w3, source_core_address, "SourceCore").functions
-    timestamp = source_w3.eth.get_block("latest").timestamp
+    latest_source_block = source_w3.eth.get_block("latest")
+    timestamp = latest_source_block.timestamp
     secure_timestamp = timestamp - SECURE_INTERVAL
-    source_block = get_block_before_timestamp(source_w3, secure_timestamp)
-    target_block = get_block_before_timestamp(target_w3, secure_timestamp)
-
-    source_nonces = source_helper.getNonces(source_core_address).call(
-        block_identifier=source_block
-    )
-    target_nonces = target_helper.getNonces(target_core_address).call(
-        block_identifier=target_block
-    )
 
-    oracle_address = source_core.oracle().call(block_identifier=source_block)
-    oracle = get_contract(source_w3, oracle_address, "Oracle").functions
-
-    oracle_value = oracle.value().call(block_identifier=source_block)
-    oracle_timestamp = oracle.lastUpdated().call(block_identifier=source_block)
-    oracle_max_age = oracle.maxAge().call(block_identifier=source_block)
+    # Source and target chains are independent endpoints, query them concurrently
+    def fetch_source_state():
+        source_block = get_cached_block_before_timestamp(
+            source_w3, secure_timestamp, latest_block=latest_source_block
+        )
+        oracle_address = _get_oracle_address(
+            source_rpc, source_core_address, source_core, source_block
+        )
+        oracle = get_contract(source_w3, oracle_address, "Oracle").functions
+        source_state = multicall(
+            source_w3,
+            [
+                bound_call(source_helper, "getNonces", source_core_address),
+                bound_call(source_helper, "getSourceValue", source_core_address),
+                bound_call(source_core, "totalSupply"),
+                bound_call(oracle, "value"),
+                bound_call(oracle, "lastUpdated"),
+                bound_call(oracle, "maxAge"),
+            ],
+            block_identifier=source_block,
+        )
+        return oracle_address, oracle, source_state
+
+    def fetch_target_state():
+        target_block = get_cached_block_before_timestamp(target_w3, secure_timestamp)
+        return multicall(
+            target_w3,
+            [
+                bound_call(target_helper, "getNonces", target_core_address),
+                bound_call(target_helper, "getTargetValue", target_core_address),
+            ],
+            block_identifier=target_block,
+        )
 
-    source_value = source_helper.getSourceValue(source_core_address).call(
-        block_identifier=source_block
-    )
-    target_value = target_helper.getTargetValue(target_core_address).call(
-        block_identifier=target_block
+    (oracle_address, oracle, source_state), target_state = run_in_parallel(
+        fetch_source_state, fetch_target_state
     )
+    (
+        source_nonces,
+        source_value,
+        total_supply,
+        oracle_value,
+        oracle_timestamp,
+        oracle_max_age,
+    ) = source_state
+    target_nonces, target_value = target_state
 
-    total_supply = source_core.totalSupply().call(block_identifier=source_block)
     secure_value = (source_value + target_value) * 10**18 // total_supply
     remaining_time = oracle_timestamp + oracle_max_age - timestamp
 
@@ -79,13 +119,14 @@ def _run_oracle_validation(
     incorrect_value = oracle_value != secure_value
 
     recently_updated = (
-        timestamp - oracle.lastUpdated().call()
+        timestamp
+        - oracle.lastUpdated().call(block_identifier=latest_source_block.number)
         <= oracle_recent_update_threshold_seconds
     )
 
     result = OracleValidationResult(
         oracle_address=oracle_address,
-        chain_id=source_w3.eth.chain_id,
+        chain_id=get_chain_id(source_w3),
         oracle_value=oracle_value,
         actual_value=secure_value,
         remaining_time=remaining_time,
@@ -212,6 +253,7 @@ def run_oracle_validation(
 if __name__ == "__main__":
     import dotenv
     import sys
+    from functools import partial
     from pathlib import Path
 
     # Add src directory to path to import config module
@@ -242,19 +284,26 @@ if __name__ == "__main__":
                 )
             )
 
-    for (
-        source_core_address,
-        target_core_address,
-        source_core_helper,
-        source_rpc,
-    ) in deployments:
-        run_oracle_validation(
-            source_core_address=source_core_address,
-            target_core_address=target_core_address,
-            source_rpc=source_rpc,
-            target_rpc=target_rpc,
-            source_core_helper=source_core_helper,
-            target_core_helper=target_core_helper,
-            oracle_expiry_threshold_seconds=config.oracle_expiry_threshold_seconds,
-            oracle_recent_update_threshold_seconds=config.oracle_recent_update_threshold_seconds,
-        )
+    # Deployments are independent, overlap their RPC latencies
+    run_in_parallel(
+        *(
+            partial(
+                run_oracle_validation,
+                source_core_address=source_core_address,
+                target_core_address=target_core_address,
+                source_rpc=source_rpc,
+                target_rpc=target_rpc,
+                source_core_helper=source_core_helper,
+                target_core_helper=target_core_helper,
+                oracle_expiry_threshold_seconds=config.oracle_expiry_threshold_seconds,
+                oracle_recent_update_threshold_seconds=config.oracle_recent_update_threshold_seconds,
+            )
+            for (
+                source_core_address,
+                target_core_address,
+                source_core_helper,
+                source_rpc,
+            ) in deployments
+        ),
+        max_workers=8,
+    )
@@ -0,0 +1,60 @@
+import unittest
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from main import compose_owner_mentions, SafeProposal
+from safe_global.common import PendingTransactionInfo, ThresholdWithOwners
+
+
+class TestComposeOwnerMentions(unittest.TestCase):
+
+    def _proposal(self, missing_confirmations):
+        owners = [
+            "0x742d35Cc6635C0532925a3b8D4f25749d6d8f0C4",
+            "0x8ba1f109551bD432803012645Ac136c8c8b2e0aB",
+        ]
+        return SafeProposal(
+            method="setValue",
+            deployment_names=["BSC"],
+            calls=[("0x1111111111111111111111111111111111111111", [1])],
+            transaction=PendingTransactionInfo(
+                id="multisig_0x1234567890123456789012345678901234567890_0xabcdef",
+                number_of_required_confirmations=2,
+                threshold_with_owners=ThresholdWithOwners(threshold=2, owners=owners),
+                confirmations=[o for o in owners if o not in missing_confirmations],
+                missing_confirmations=missing_confirmations,
+            ),
+            is_newly_created=True,
+        )
+
+    def test_mentions_owners_with_missing_confirmations(self):
+        """Only owners who have not confirmed yet are mentioned, in config order"""
+        nicknames = {
+            "alice": "0x742d35Cc6635C0532925a3b8D4f25749d6d8f0C4",
+            "bob_x": "0x8ba1f109551bD432803012645Ac136c8c8b2e0aB",
+        }
+        proposal = self._proposal(
+            [
+                "0x8ba1f109551bD432803012645Ac136c8c8b2e0aB",
+                "0x742d35Cc6635C0532925a3b8D4f25749d6d8f0C4",
+            ]
+        )
+        self.assertEqual(
+            compose_owner_mentions(nicknames, proposal), "@alice, @bob\\_x"
+        )
+
+        proposal = self._proposal(["0x8ba1f109551bD432803012645Ac136c8c8b2e0aB"])
+        self.assertEqual(compose_owner_mentions(nicknames, proposal), "@bob\\_x")
+
+    def test_address_casing_is_ignored(self):
+        """Lowercase configured addresses match checksummed API addresses"""
+        nicknames = {"alice": "0x742d35cc6635c0532925a3b8d4f25749d6d8f0c4"}
+        proposal = self._proposal(["0x742d35Cc6635C0532925a3b8D4f25749d6d8f0C4"])
+        self.assertEqual(compose_owner_mentions(nicknames, proposal), "@alice")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from types import SimpleNamespace
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from web3_scripts.base import (
+    get_block_before_timestamp,
+    get_cached_block_before_timestamp,
+)
+
+
+class FakeEth:
+    def __init__(self, timestamps):
+        self.timestamps = timestamps
+        self.requested = []
+
+    def get_block(self, block_identifier):
+        if block_identifier == "latest":
+            block_identifier = len(self.timestamps) - 1
+        self.requested.append(block_identifier)
+        return SimpleNamespace(
+            number=block_identifier, timestamp=self.timestamps[block_identifier]
+        )
+
+
+class FakeWeb3:
+    def __init__(self, timestamps):
+        self.eth = FakeEth(timestamps)
+
+
+def make_w3(timestamps):
+    return FakeWeb3(timestamps)
+
+
+def expected_block(timestamps, timestamp):
+    return max(i for i, value in enumerate(timestamps) if value <= timestamp)
+
+
+class TestGetBlockBeforeTimestamp(unittest.TestCase):
+
+    def test_regular_block_time(self):
+        """Test lookup on a chain with constant block time"""
+        timestamps = [1_000_000 + 2 * i for i in range(50_000)]
+        for timestamp in [1_000_001, 1_030_000, 1_050_001, 1_099_997]:
+            w3 = make_w3(timestamps)
+            self.assertEqual(
+                get_block_before_timestamp(w3, timestamp),
+                expected_block(timestamps, timestamp),
+            )
+
+    def test_variable_block_time(self):
+        """Test that a poor estimate is still resolved with few requests"""
+        # Slow blocks first, then a long run of fast blocks skews the estimate
+        timestamps = [1_000_000 + 12 * i for i in range(20_000)]
+        timestamps += [timestamps[-1] + i + 1 for i in range(30_000)]
+        timestamp = 1_000_000 + 12 * 5_000 + 7
+        w3 = make_w3(timestamps)
+
+        self.assertEqual(
+            get_block_before_timestamp(w3, timestamp),
+            expected_block(timestamps, timestamp),
+        )
+        self.assertLess(len(w3.eth.requested), 40)
+
+    def test_repeated_timestamps(self):
+        """Test that the last block sharing a timestamp is returned"""
+        timestamps = [1_000_000 + i // 4 for i in range(40_000)]
+        timestamp = 1_005_000
+        w3 = make_w3(timestamps)
+
+        self.assertEqual(get_block_before_timestamp(w3, timestamp), 20_003)
+
+    def test_timestamp_after_latest_block(self):
+        """Test that the latest block is returned for future timestamps"""
+        timestamps = [1_000_000 + i for i in range(20_000)]
+        w3 = make_w3(timestamps)
+
+        self.assertEqual(get_block_before_timestamp(w3, 2_000_000), 19_999)
+
+    def test_timestamp_before_genesis(self):
+        """Test that an exception is raised when no block is old enough"""
+        timestamps = [1_000_000 + i for i in range(20_000)]
+        w3 = make_w3(timestamps)
+
+        with self.assertRaises(Exception) as context:
+            get_block_before_timestamp(w3, 999_999)
+
+        self.assertIn("Block not found", str(context.exception))
+
+    def test_cached_lookup_shares_timestamp_bucket(self):
+        """Test that lookups within the same minute reuse one block search"""
+        timestamps = [1_000_000 + 2 * i for i in range(20_000)]
+        w3 = make_w3(timestamps)
+
+        first = get_cached_block_before_timestamp(w3, 1_020_005)
+        requests_count = len(w3.eth.requested)
+        second = get_cached_block_before_timestamp(w3, 1_020_059)
+
+        self.assertEqual(first, expected_block(timestamps, 1_020_000))
+        self.assertEqual(second, first)
+        self.assertEqual(len(w3.eth.requested), requests_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
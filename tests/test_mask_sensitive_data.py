@@ -453,6 +453,26 @@ class TestMaskAllSensitiveConfigData(unittest.TestCase):
         # Should not crash and return message
         self.assertEqual(message, result)
 
+    def test_mask_without_sensitive_values(self):
+        """Test masking with a config that has nothing to mask"""
+        config = Config(
+            telegram_bot_api_key="",
+            telegram_group_chat_id="",
+            telegram_owner_nicknames={},
+            telegram_proposal_message_prefix="",
+            oracle_expiry_threshold_seconds=3600,
+            oracle_recent_update_threshold_seconds=300,
+            target_rpc="",
+            target_core_helper="0x4444444444444444444444444444444444444444",
+            sources=[],
+        )
+
+        message = "Error occurred"
+        result = mask_all_sensitive_config_data(message, config)
+
+        self.assertIsNone(config.sensitive_values_re)
+        self.assertEqual(message, result)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,307 @@
+import io
+import threading
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.providers.base import JSONBaseProvider
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from web3_scripts.base import (
+    MULTICALL3_ADDRESS,
+    OFFLINE_W3,
+    batch_call,
+    bound_call,
+    call_prepared,
+    multicall,
+    prepare_call,
+    run_in_parallel,
+    run_in_parallel_buffered,
+)
+
+READER_ADDRESS = "0x1111111111111111111111111111111111111111"
+OWNER_ADDRESS = "0x742d35Cc6635c0532925A3B8D4f25749d6D8f0c4"
+OTHER_ADDRESS = "0x8ba1f109551BD432803012645ac136c8c8B2E0ab"
+SYMBOL_ID = b"mellow".ljust(32, b"\0")
+
+
+def _function(name, inputs, outputs):
+    return {
+        "type": "function",
+        "name": name,
+        "stateMutability": "view",
+        "inputs": [{"name": "", "type": t} for t in inputs],
+        "outputs": [{"name": "", "type": t} for t in outputs],
+    }
+
+
+READER_ABI = [
+    _function("value", [], ["uint256"]),
+    _function("owner", [], ["address"]),
+    _function("symbol", [], ["string"]),
+    _function("id", [], ["bytes32"]),
+    _function("state", [], ["uint256", "address"]),
+    _function("balanceOf", ["address"], ["uint256"]),
+]
+
+
+class Revert(Exception):
+    pass
+
+
+class FakeProvider(JSONBaseProvider):
+    """
+    Serves eth_call from a table of (address, calldata) -> return data, with an
+    optional Multicall3 that dispatches aggregate3 calls to the same table.
+    Calls missing from the table return no data (no code), None entries revert.
+    """
+
+    def __init__(self, responses, has_multicall3=True):
+        super().__init__()
+        self.responses = responses
+        self.has_multicall3 = has_multicall3
+        self.methods = []
+        self.batches = 0
+
+    def _call(self, to: str, data: bytes) -> bytes:
+        if self.has_multicall3 and to.lower() == MULTICALL3_ADDRESS.lower():
+            (calls,) = OFFLINE_W3.codec.decode(["(address,bool,bytes)[]"], data[4:])
+            results = []
+            for target, allow_failure, calldata in calls:
+                try:
+                    results.append((True, self._call(target, calldata)))
+                except Revert:
+                    if not allow_failure:
+                        raise
+                    results.append((False, b""))
+            return OFFLINE_W3.codec.encode(["(bool,bytes)[]"], [results])
+        return_data = self.responses.get((to.lower(), HexBytes(data).to_0x_hex()), b"")
+        if return_data is None:
+            raise Revert()
+        return return_data
+
+    def _result(self, method, params):
+        self.methods.append(method)
+        if method == "eth_chainId":
+            return "0x1"
+        if method == "eth_getCode":
+            is_multicall3 = params[0].lower() == MULTICALL3_ADDRESS.lower()
+            return "0x60806040" if self.has_multicall3 and is_multicall3 else "0x"
+        if method == "eth_call":
+            transaction = params[0]
+            return self._call(transaction["to"], HexBytes(transaction["data"])).hex()
+        raise NotImplementedError(method)
+
+    def _response(self, id, method, params):
+        try:
+            return {"jsonrpc": "2.0", "id": id, "result": self._result(method, params)}
+        except Revert:
+            error = {"code": 3, "message": "execution reverted"}
+            return {"jsonrpc": "2.0", "id": id, "error": error}
+
+    def make_request(self, method, params):
+        return self._response(1, method, params)
+
+    def make_batch_request(self, requests):
+        self.batches += 1
+        return [
+            self._response(index, method, params)
+            for index, (method, params) in enumerate(requests)
+        ]
+
+
+class TestMulticall(unittest.TestCase):
+
+    def setUp(self):
+        reader = OFFLINE_W3.eth.contract(address=READER_ADDRESS, abi=READER_ABI)
+        functions = reader.functions
+        encode = OFFLINE_W3.codec.encode
+        self.calls = [
+            functions.value(),
+            functions.owner(),
+            functions.symbol(),
+            functions.id(),
+            functions.state(),
+            functions.balanceOf(OTHER_ADDRESS),
+        ]
+        returns = [
+            encode(["uint256"], [10**18]),
+            # Lowercase on the wire, decoded as a checksum address
+            encode(["address"], [OWNER_ADDRESS.lower()]),
+            encode(["string"], ["mUSD"]),
+            encode(["bytes32"], [SYMBOL_ID]),
+            encode(["uint256", "address"], [42, OTHER_ADDRESS]),
+            encode(["uint256"], [7]),
+        ]
+        self.expected = [
+            10**18,
+            OWNER_ADDRESS,
+            "mUSD",
+            SYMBOL_ID,
+            [42, OTHER_ADDRESS],
+            7,
+        ]
+        self.responses = {
+            (READER_ADDRESS.lower(), prepare_call(call).data): return_data
+            for call, return_data in zip(self.calls, returns)
+        }
+
+    def make_w3(self, has_multicall3):
+        provider = FakeProvider(self.responses, has_multicall3=has_multicall3)
+        return Web3(provider), provider
+
+    def test_multicall3(self):
+        """Test that aggregate3 results are unpacked and decoded like call()"""
+        w3, provider = self.make_w3(has_multicall3=True)
+        self.assertEqual(multicall(w3, self.calls), self.expected)
+        # One code check and one aggregated call, no batch
+        self.assertEqual(provider.methods.count("eth_call"), 1)
+        self.assertEqual(provider.batches, 0)
+
+    def test_fallback_without_multicall3(self):
+        """Test the JSON-RPC batch fallback when Multicall3 has no code"""
+        w3, provider = self.make_w3(has_multicall3=False)
+        self.assertEqual(multicall(w3, self.calls), self.expected)
+        self.assertIn("eth_getCode", provider.methods)
+        self.assertEqual(provider.batches, 1)
+        self.assertEqual(provider.methods.count("eth_call"), len(self.calls))
+
+    def test_batch_call(self):
+        """Test that batch_call decodes the same results as multicall"""
+        w3, _ = self.make_w3(has_multicall3=True)
+        self.assertEqual(batch_call(w3, self.calls), self.expected)
+
+    def test_single_and_multiple_outputs(self):
+        """Test that a single output is unwrapped and multiple outputs are a list"""
+        w3, _ = self.make_w3(has_multicall3=True)
+        self.assertEqual(call_prepared(w3, self.calls[0]), 10**18)
+        self.assertEqual(call_prepared(w3, self.calls[4]), [42, OTHER_ADDRESS])
+
+    def test_address_is_checksummed(self):
+        """Test that returned addresses are normalized to checksum casing"""
+        w3, _ = self.make_w3(has_multicall3=True)
+        self.assertEqual(call_prepared(w3, self.calls[1]), OWNER_ADDRESS)
+
+    def test_string_and_bytes32(self):
+        """Test that string returns are text and bytes32 returns stay raw bytes"""
+        w3, _ = self.make_w3(has_multicall3=True)
+        self.assertEqual(call_prepared(w3, self.calls[2]), "mUSD")
+        self.assertEqual(call_prepared(w3, self.calls[3]), SYMBOL_ID)
+        self.assertIsInstance(call_prepared(w3, self.calls[3]), bytes)
+
+    def test_prepared_calls(self):
+        """Test that prepared and bound calls are accepted as-is"""
+        w3, _ = self.make_w3(has_multicall3=True)
+        reader = OFFLINE_W3.eth.contract(address=READER_ADDRESS, abi=READER_ABI)
+        calls = [
+            prepare_call(self.calls[2]),
+            bound_call(reader.functions, "balanceOf", OTHER_ADDRESS),
+        ]
+        self.assertEqual(multicall(w3, calls), ["mUSD", 7])
+
+    def test_failed_call_is_named(self):
+        """Test that reverts and undecodable results name the function and address"""
+        for has_multicall3 in (True, False):
+            with self.subTest(has_multicall3=has_multicall3):
+                self.responses[
+                    (READER_ADDRESS.lower(), prepare_call(self.calls[1]).data)
+                ] = None
+                w3, _ = self.make_w3(has_multicall3=has_multicall3)
+                with self.assertRaises(Exception) as context:
+                    multicall(w3, self.calls)
+                self.assertIn(f"owner() on {READER_ADDRESS}", str(context.exception))
+
+                # No code at the address, the result is empty
+                del self.responses[
+                    (READER_ADDRESS.lower(), prepare_call(self.calls[1]).data)
+                ]
+                with self.assertRaises(Exception) as context:
+                    multicall(w3, self.calls)
+                self.assertIn(
+                    f"Failed to decode result of owner() on {READER_ADDRESS}",
+                    str(context.exception),
+                )
+                self.setUp()
+
+    def test_allow_failure(self):
+        """Test that failed calls are returned as exceptions with allow_failure"""
+        self.responses[(READER_ADDRESS.lower(), prepare_call(self.calls[2]).data)] = (
+            None
+        )
+        for has_multicall3 in (True, False):
+            with self.subTest(has_multicall3=has_multicall3):
+                w3, _ = self.make_w3(has_multicall3=has_multicall3)
+                results = multicall(w3, self.calls, allow_failure=True)
+                self.assertIsInstance(results[2], Exception)
+                self.assertIn(f"symbol() on {READER_ADDRESS}", str(results[2]))
+                self.assertEqual(
+                    results[:2] + results[3:], self.expected[:2] + self.expected[3:]
+                )
+
+    def test_empty_calls(self):
+        """Test that no request is sent for an empty call list"""
+        w3, provider = self.make_w3(has_multicall3=True)
+        self.assertEqual(multicall(w3, []), [])
+        self.assertEqual(provider.methods, [])
+
+
+class TestRunInParallel(unittest.TestCase):
+
+    def test_results_in_task_order(self):
+        """Test that results follow task order, with and without a worker cap"""
+        tasks = [lambda i=i: i * i for i in range(5)]
+        self.assertEqual(run_in_parallel(*tasks), [0, 1, 4, 9, 16])
+        self.assertEqual(run_in_parallel(*tasks, max_workers=2), [0, 1, 4, 9, 16])
+
+    def test_no_tasks(self):
+        """Test that no tasks yield no results instead of an executor error"""
+        self.assertEqual(run_in_parallel(), [])
+        self.assertEqual(run_in_parallel(max_workers=8), [])
+
+    def test_buffered_output_in_task_order(self):
+        """Test that the output of each task is printed as one block, in task order"""
+        first_started = threading.Event()
+        second_done = threading.Event()
+
+        def first():
+            print("first: start")
+            first_started.set()
+            second_done.wait(5)
+            print("first: end")
+            return 1
+
+        def second():
+            first_started.wait(5)
+            print("second: start")
+            print("second: end")
+            second_done.set()
+            return 2
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            results = run_in_parallel_buffered(first, second)
+        self.assertEqual(results, [1, 2])
+        self.assertEqual(
+            stdout.getvalue(),
+            "first: start\nfirst: end\nsecond: start\nsecond: end\n",
+        )
+
+    def test_buffered_failure(self):
+        """Test that output before a failure is printed and the failure re-raised"""
+
+        def failing():
+            print("failing: start")
+            raise ValueError("boom")
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            with self.assertRaises(ValueError):
+                run_in_parallel_buffered(lambda: print("ok"), failing)
+        self.assertEqual(stdout.getvalue(), "ok\nfailing: start\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,282 @@
+import os
+import sys
+import unittest
+import importlib.util
+from contextlib import redirect_stdout
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+
+def load_validate_config():
+    """Load the validate_config module with mocked dependencies"""
+    root = os.path.dirname(os.path.dirname(__file__))
+    path = os.path.join(root, "src", "config", "validate_config.py")
+
+    # Create proper mock for web3_scripts that includes real Web3
+    mock_web3_scripts = MagicMock()
+    from web3 import Web3
+
+    mock_web3_scripts.Web3 = Web3
+
+    # Temporarily add mocks to sys.modules
+    original_modules = {}
+    modules_to_mock = {
+        "web3_scripts": mock_web3_scripts,
+        "safe_global": MagicMock(),
+        "config": MagicMock(),
+        "config.read_config": MagicMock(),
+        "config.mask_sensitive_data": MagicMock(),
+    }
+
+    for module_name, mock_module in modules_to_mock.items():
+        if module_name in sys.modules:
+            original_modules[module_name] = sys.modules[module_name]
+        sys.modules[module_name] = mock_module
+
+    try:
+        spec = importlib.util.spec_from_file_location("validate_config", path)
+        mod = importlib.util.module_from_spec(spec)
+        assert spec and spec.loader
+        spec.loader.exec_module(mod)
+        return mod
+    finally:
+        # Restore original modules
+        for module_name in modules_to_mock.keys():
+            if module_name in original_modules:
+                sys.modules[module_name] = original_modules[module_name]
+            else:
+                sys.modules.pop(module_name, None)
+
+
+class TestParseSafeVersion(unittest.TestCase):
+    def setUp(self):
+        self.validate_config = load_validate_config()
+        self.parse = self.validate_config._parse_safe_version
+
+    def test_release_versions(self):
+        """Test plain release versions"""
+        self.assertEqual(self.parse("1.3.0"), (1, 3, 0))
+        self.assertEqual(self.parse("1.4.1"), (1, 4, 1))
+
+    def test_l2_suffix(self):
+        """Test that the +L2 build suffix is ignored"""
+        self.assertEqual(self.parse("1.3.0+L2"), (1, 3, 0))
+        self.assertEqual(self.parse("1.4.1+L2"), (1, 4, 1))
+
+    def test_short_version_is_padded(self):
+        """Test that missing minor/patch parts are padded with zeros"""
+        self.assertEqual(self.parse("1.3"), (1, 3, 0))
+        self.assertEqual(self.parse("2"), (2, 0, 0))
+
+    def test_comparison_with_min_version(self):
+        """Test that parsed versions compare against MIN_SAFE_VERSION"""
+        min_version = self.validate_config.MIN_SAFE_VERSION
+        self.assertLess(self.parse("1.2.0"), min_version)
+        self.assertGreaterEqual(self.parse("1.3"), min_version)
+        self.assertGreaterEqual(self.parse("1.3.0+L2"), min_version)
+
+    def test_malformed_versions(self):
+        """Test that malformed versions raise a validation error"""
+        for version in ["", "abc", "1..3", "1.3.0-beta", "v1.3.0", "1.3.0.1", None]:
+            with self.subTest(version=version):
+                with self.assertRaises(Exception) as context:
+                    self.parse(version)
+                self.assertIn("Invalid Safe contract version", str(context.exception))
+
+
+def make_deployment(name, source_core, target_core):
+    return SimpleNamespace(name=name, source_core=source_core, target_core=target_core)
+
+
+class TestValidateDeploymentsStructure(unittest.TestCase):
+    def setUp(self):
+        self.validate = load_validate_config().validate_deployments_structure
+
+    def make_source(self, *deployments):
+        return SimpleNamespace(name="BSC", deployments=list(deployments))
+
+    def assert_invalid(self, source, message):
+        with self.assertRaises(Exception) as context:
+            self.validate(source)
+        self.assertIn(message, str(context.exception))
+
+    def test_valid_deployments(self):
+        """Test that distinct, non-empty deployments pass"""
+        self.validate(
+            self.make_source(
+                make_deployment("USDC", "0x01", "0x02"),
+                make_deployment("USDT", "0x03", "0x04"),
+            )
+        )
+
+    def test_no_deployments(self):
+        """Test that a source without deployments passes"""
+        self.validate(self.make_source())
+
+    def test_empty_name(self):
+        """Test that an empty deployment name is rejected"""
+        self.assert_invalid(
+            self.make_source(make_deployment("", "0x01", "0x02")),
+            "Deployment name cannot be empty",
+        )
+
+    def test_empty_cores(self):
+        """Test that empty source or target cores are rejected"""
+        self.assert_invalid(
+            self.make_source(make_deployment("USDC", "", "0x02")),
+            "Source core cannot be empty",
+        )
+        self.assert_invalid(
+            self.make_source(make_deployment("USDC", "0x01", "")),
+            "Target core cannot be empty",
+        )
+
+    def test_same_cores(self):
+        """Test that equal source and target cores are rejected"""
+        self.assert_invalid(
+            self.make_source(make_deployment("USDC", "0x01", "0x01")),
+            "Source core and target core must be different",
+        )
+
+    def test_duplicates(self):
+        """Test that duplicate names and cores are reported with their values"""
+        self.assert_invalid(
+            self.make_source(
+                make_deployment("USDC", "0x01", "0x02"),
+                make_deployment("USDC", "0x03", "0x04"),
+            ),
+            "'USDC'",
+        )
+        self.assert_invalid(
+            self.make_source(
+                make_deployment("USDC", "0x01", "0x02"),
+                make_deployment("USDT", "0x01", "0x04"),
+            ),
+            "'0x01'",
+        )
+        self.assert_invalid(
+            self.make_source(
+                make_deployment("USDC", "0x01", "0x02"),
+                make_deployment("USDT", "0x03", "0x02"),
+            ),
+            "'0x02'",
+        )
+
+
+class TestValidateSymbol(unittest.TestCase):
+    def setUp(self):
+        self.validate_config = load_validate_config()
+
+    def validate(self, name, *symbols):
+        state = self.validate_config.DeploymentState(b"", b"", *symbols)
+        with redirect_stdout(StringIO()):
+            self.validate_config.validate_symbol(
+                make_deployment(name, "0x01", "0x02"), state
+            )
+
+    def test_matching_symbols(self):
+        """Test that the name must be a substring of every symbol"""
+        self.validate("USDC", "mUSDC", "USDC-OFT", "mwUSDC")
+
+    def test_case_insensitive(self):
+        """Test that symbols may use a different case than the name"""
+        self.validate("USDC", "musdc", "UsdC-oft", "mwUSDC")
+
+    def test_mismatched_symbols(self):
+        """Test that mismatched symbols are listed in the error"""
+        with self.assertRaises(Exception) as context:
+            self.validate("USDC", "mUSDC", "USDT-OFT", "mwUSDC")
+        self.assertIn("USDT-OFT do not match", str(context.exception))
+
+    def test_underscore_prefix_skips_validation(self):
+        """Test that names starting with '_' skip symbol validation"""
+        self.validate("_USDC", None, None, None)
+
+
+SOURCE_CORE = "0x1111111111111111111111111111111111111111"
+TARGET_CORE = "0x2222222222222222222222222222222222222222"
+OFT = "0x3333333333333333333333333333333333333333"
+VAULT = "0x4444444444444444444444444444444444444444"
+
+
+class TestValidateDeployments(unittest.TestCase):
+    def setUp(self):
+        self.validate_config = load_validate_config()
+        # Contract reads are served from (contract address, function) -> value
+        self.values = {
+            (SOURCE_CORE, "targetCoreAddress"): bytes(12)
+            + bytes.fromhex(TARGET_CORE[2:]),
+            (SOURCE_CORE, "symbol"): "mUSDC",
+            (TARGET_CORE, "sourceCoreAddress"): bytes(12)
+            + bytes.fromhex(SOURCE_CORE[2:]),
+            (TARGET_CORE, "oft"): OFT,
+            (TARGET_CORE, "vault"): VAULT,
+            (OFT, "symbol"): "USDC-OFT",
+            (VAULT, "symbol"): "mwUSDC",
+        }
+        self.multicalls = []
+
+        def multicall(w3, calls, allow_failure=False):
+            self.multicalls.append(calls)
+            return [self.values[call] for call in calls]
+
+        self.validate_config.get_contract = lambda w3, address, name: SimpleNamespace(
+            functions=address
+        )
+        self.validate_config.bound_call = lambda address, name: (address, name)
+        self.validate_config.multicall = multicall
+        self.validate_config.run_in_parallel = lambda *tasks: [task() for task in tasks]
+        self.source = SimpleNamespace(
+            name="BSC", deployments=[make_deployment("USDC", SOURCE_CORE, TARGET_CORE)]
+        )
+
+    def validate(self):
+        with redirect_stdout(StringIO()) as stdout:
+            try:
+                self.validate_config.validate_deployments(None, None, self.source)
+            finally:
+                self.output = stdout.getvalue()
+
+    def test_valid_deployment(self):
+        """Test that a valid pair and matching symbols pass"""
+        self.validate()
+        self.assertIn("Validating deployment pair USDC", self.output)
+        self.assertIn("matches every symbol", self.output)
+
+    def test_failed_read_names_deployment(self):
+        """Test that a failed read is reported for its deployment"""
+        self.values[(TARGET_CORE, "sourceCoreAddress")] = Exception(
+            f"Call to sourceCoreAddress() on {TARGET_CORE} reverted"
+        )
+        with self.assertRaises(Exception) as context:
+            self.validate()
+        message = str(context.exception)
+        self.assertIn("deployment USDC", message)
+        self.assertIn(f"sourceCoreAddress() on {TARGET_CORE}", message)
+        self.assertIn("Validating deployment pair USDC", self.output)
+
+    def test_pair_mismatch_before_symbol_reads(self):
+        """Test that a pair mismatch is raised before token symbols are read"""
+        self.values[(SOURCE_CORE, "targetCoreAddress")] = bytes(32)
+        del self.values[(OFT, "symbol")]
+        with self.assertRaises(Exception) as context:
+            self.validate()
+        self.assertIn("Target core address mismatch for USDC", str(context.exception))
+        # Only the source and target core reads were sent
+        self.assertEqual(len(self.multicalls), 2)
+
+    def test_failed_symbol_read_names_deployment(self):
+        """Test that a failed token symbol read is reported for its deployment"""
+        self.values[(VAULT, "symbol")] = Exception(
+            f"Failed to decode result of symbol() on {VAULT}"
+        )
+        with self.assertRaises(Exception) as context:
+            self.validate()
+        message = str(context.exception)
+        self.assertIn("deployment USDC", message)
+        self.assertIn(f"symbol() on {VAULT}", message)
+
+
+if __name__ == "__main__":
+    unittest.main()